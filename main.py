@@ -2,9 +2,14 @@ import streamlit as st
 import sys
 import os
 import pickle
+import shutil
+import tempfile
 import json
+import hmac
+import hashlib
+import secrets
+import lz4.frame
 import pandas as pd
-from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -12,61 +17,95 @@ from src.data_processor import DataProcessor
 from src.team_manager import TeamManager
 from src.comparison_manager import ComparisonManager
 from src.config import PAGE_CONFIG
+from src.utils import DATA_DIR
 
+# Saved data is signed so a tampered file is never unpickled
+SIGNATURE_SIZE = hashlib.sha256().digest_size
+SIGNING_KEY_FILE = DATA_DIR.parent / ".signing_key"
 
-def create_data_dir():
-    """Create data directory if it doesn't exist"""
-    data_dir = Path("data/temp")
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+
+def get_signing_key():
+    """Get the key used to sign saved data, creating one on first use"""
+    env_key = os.environ.get("FOOTBALL_ANALYTICS_SECRET")
+    if env_key:
+        return env_key.encode('utf-8')
+
+    try:
+        return SIGNING_KEY_FILE.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    key = secrets.token_bytes(32)
+    try:
+        # Exclusive create, owner-only: if another session created the key first, use theirs
+        fd = os.open(SIGNING_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return SIGNING_KEY_FILE.read_bytes()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+def sign_payload(payload):
+    """Compute the HMAC-SHA256 signature of a payload"""
+    return hmac.new(get_signing_key(), payload, hashlib.sha256).digest()
 
 
 def save_data_processor(data_processor):
     """Save data processor to disk"""
     if data_processor:
-        data_dir = create_data_dir()
-        with open(data_dir / "data_processor.pkl", "wb") as f:
-            pickle.dump(data_processor, f)
+        # Serialize first so the file is written with a single write call
+        payload = lz4.frame.compress(pickle.dumps(data_processor, protocol=5))
+        # Write to a temp file and swap it in, so concurrent loads never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(sign_payload(payload) + payload)
+            os.replace(tmp_path, DATA_DIR / "data_processor.pkl")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        # Let other sessions pick up the new data on their next load
+        load_data_processor.clear()
 
 
+@st.cache_resource(show_spinner=False)
 def load_data_processor():
-    """Load data processor from disk"""
-    data_dir = create_data_dir()
-    pkl_file = data_dir / "data_processor.pkl"
+    """Load data processor from disk (read once per server process)
 
-    if pkl_file.exists():
-        try:
-            with open(pkl_file, "rb") as f:
-                return pickle.load(f)
-        except Exception as e:
-            print(f"Error loading data: {e}")
-    return None
+    Raises instead of returning None so a failed load is never cached and the
+    next session tries the disk again.
+    """
+    data = (DATA_DIR / "data_processor.pkl").read_bytes()
+    signature, payload = data[:SIGNATURE_SIZE], data[SIGNATURE_SIZE:]
+
+    # Verify before unpickling - unsigned or modified files are ignored
+    if not hmac.compare_digest(signature, sign_payload(payload)):
+        raise ValueError("Saved data failed integrity check, please upload the files again")
+
+    return pickle.loads(lz4.frame.decompress(payload))
 
 
 def save_session_config():
     """Save current session configuration"""
     if st.session_state.get('selected_team'):
-        data_dir = create_data_dir()
         config = {
             'selected_team': st.session_state.selected_team,
             'has_data': st.session_state.data_processor is not None,
             'current_page': st.session_state.get('current_page', 'dashboard')
         }
-        with open(data_dir / "session_config.json", "w") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        payload = json.dumps(config, ensure_ascii=False, indent=2).encode('utf-8')
+        (DATA_DIR / "session_config.json").write_bytes(payload)
 
 
 def load_session_config():
     """Load session configuration"""
-    data_dir = create_data_dir()
-    config_file = data_dir / "session_config.json"
-
-    if config_file.exists():
-        try:
-            with open(config_file, "r", encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading config: {e}")
+    try:
+        return json.loads((DATA_DIR / "session_config.json").read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading config: {e}")
     return {}
 
 
@@ -85,37 +124,57 @@ def initialize_session_state():
     if 'ranking_system' not in st.session_state:
         st.session_state.ranking_system = None
 
-    # Try to load saved data
+    # Try to load saved data (disk is only hit on the first load of the process)
     if st.session_state.data_processor is None:
-        saved_data = load_data_processor()
-        if saved_data:
-            st.session_state.data_processor = saved_data
+        try:
+            st.session_state.data_processor = load_data_processor()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading data: {e}")
 
-    # Load saved config
-    saved_config = load_session_config()
-    if saved_config.get('selected_team') and not st.session_state.selected_team:
-        st.session_state.selected_team = saved_config['selected_team']
-    if saved_config.get('current_page'):
-        st.session_state.current_page = saved_config['current_page']
+    # Load saved config once per session - afterwards session state is the source of truth
+    if not st.session_state.get('config_loaded'):
+        st.session_state.config_loaded = True
+        saved_config = load_session_config()
+        if saved_config.get('selected_team') and not st.session_state.selected_team:
+            st.session_state.selected_team = saved_config['selected_team']
+        if saved_config.get('current_page'):
+            st.session_state.current_page = saved_config['current_page']
 
 
-def main():
-    st.set_page_config(**PAGE_CONFIG)
-    initialize_session_state()
+PAGE_OPTIONS = {
+    'dashboard': '🏠 Team Dashboard',
+    'player_profile': '👤 Player Profile',
+    'scouting': '🔍 Scouting',
+    'settings': '⚙️ Customize & Personalize Metrics'
+}
+
 
-    st.sidebar.title("⚽ Football Analytics")
+@st.fragment
+def show_sidebar():
+    """Sidebar with data upload, team selection and navigation.
+
+    Runs as a fragment so sidebar interactions only rerun the sidebar; a full
+    app rerun is triggered only when state the page body depends on changes.
+    """
+    st.title("⚽ Football Analytics")
+
+    upload_message = st.session_state.pop('upload_message', None)
+    if upload_message:
+        st.success(upload_message)
 
     # Show status if data is loaded (simplified - removed duplicate analysis)
     if st.session_state.data_processor:
-        st.sidebar.success("📊 Data loaded from previous session")
+        st.success("📊 Data loaded from previous session")
 
         # Clear data option
-        if st.sidebar.button("🗑️ Clear Saved Data"):
+        if st.button("🗑️ Clear Saved Data"):
             clear_saved_data()
             st.rerun()
 
     # File upload
-    uploaded_files = st.sidebar.file_uploader(
+    uploaded_files = st.file_uploader(
         "Upload Wyscout CSVs",
         type="csv",
         accept_multiple_files=True,
@@ -129,60 +188,65 @@ def main():
                 try:
                     st.session_state.data_processor = DataProcessor(uploaded_files)
                     save_data_processor(st.session_state.data_processor)
-                    st.sidebar.success(f"✅ {len(uploaded_files)} files loaded & saved")
+                    # Shown after the rerun below, which would otherwise wipe it immediately
+                    st.session_state.upload_message = f"✅ {len(uploaded_files)} files loaded & saved"
 
                     # Clear systems to force recreation with new data
                     st.session_state.ranking_system = None
 
                 except Exception as e:
-                    st.sidebar.error(f"❌ Error: {str(e)}")
+                    st.error(f"❌ Error: {str(e)}")
                     return
 
+            st.rerun()
+
     # Team selection
     if st.session_state.data_processor:
-        teams = st.session_state.data_processor.get_teams()
-        selected_team = st.sidebar.selectbox(
+        team_index = st.session_state.data_processor.team_index
+        selected_team = st.selectbox(
             "Select Team",
-            teams,
-            index=teams.index(st.session_state.selected_team) if st.session_state.selected_team in teams else 0
+            list(team_index),
+            index=team_index.get(st.session_state.selected_team, 0)
         )
 
-        if selected_team != st.session_state.selected_team:
-            st.session_state.selected_team = selected_team
-            save_session_config()
-
         # Navigation menu (updated)
-        st.sidebar.markdown("---")
-        st.sidebar.markdown("### 🧭 Navigation")
-
-        page_options = {
-            'dashboard': '🏠 Team Dashboard',
-            'player_profile': '👤 Player Profile',
-            'scouting': '🔍 Scouting',
-            'settings': '⚙️ Customize & Personalize Metrics'
-        }
-
-        # Handle player profile navigation
-        if st.session_state.show_player_profile and st.session_state.selected_player:
-            st.session_state.current_page = 'player_profile'
-            st.session_state.show_player_profile = False
+        st.markdown("---")
+        st.markdown("### 🧭 Navigation")
 
-        # Ensure current_page is valid
-        if st.session_state.current_page not in page_options:
-            st.session_state.current_page = 'dashboard'
-
-        current_page = st.sidebar.radio(
+        current_page = st.radio(
             "Select Page",
-            list(page_options.keys()),
-            format_func=lambda x: page_options[x],
-            index=list(page_options.keys()).index(st.session_state.current_page)
+            list(PAGE_OPTIONS.keys()),
+            format_func=lambda x: PAGE_OPTIONS[x],
+            index=list(PAGE_OPTIONS.keys()).index(st.session_state.current_page)
         )
 
-        if current_page != st.session_state.current_page:
+        if (selected_team != st.session_state.selected_team
+                or current_page != st.session_state.current_page):
+            st.session_state.selected_team = selected_team
             st.session_state.current_page = current_page
             save_session_config()
+            st.rerun()
 
+
+def main():
+    st.set_page_config(**PAGE_CONFIG)
+    initialize_session_state()
+
+    # Handle player profile navigation
+    if st.session_state.show_player_profile and st.session_state.selected_player:
+        st.session_state.current_page = 'player_profile'
+        st.session_state.show_player_profile = False
+
+    # Ensure current_page is valid
+    if st.session_state.current_page not in PAGE_OPTIONS:
+        st.session_state.current_page = 'dashboard'
+
+    with st.sidebar:
+        show_sidebar()
+
+    if st.session_state.data_processor and st.session_state.selected_team:
         # Show selected page
+        current_page = st.session_state.current_page
         if current_page == 'dashboard':
             show_team_dashboard_page()
         elif current_page == 'player_profile':
@@ -198,14 +262,11 @@ def main():
 
 def clear_saved_data():
     """Clear all saved data"""
-    data_dir = create_data_dir()
+    load_data_processor.clear()
 
-    # Remove saved files
-    for file_path in data_dir.glob("*"):
-        try:
-            file_path.unlink()
-        except Exception as e:
-            print(f"Error removing {file_path}: {e}")
+    # Remove saved files in one pass and recreate the empty directory
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     # Clear session state
     st.session_state.data_processor = None
@@ -1,8 +1,248 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import numpy as np
-from typing import Dict, List
+import itertools
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from src.config import POSITION_ROLES
+
+# A single displayed metric.
+# kind: 'per90' (source * 90 / minutes), 'pct_ratio' (source / denom * 100),
+#       'pct_string' (percentage column, numeric after load but tolerant of '%' strings) or 'raw'.
+# fmt: format string for the value, None to pass the raw value through.
+# fallback (pct_ratio only): 'denom' when a missing source column defaults to the
+#       denominator, 'source' when a missing denominator defaults to the source,
+#       None when missing columns count as 0.
+MetricSpec = namedtuple('MetricSpec', 'label source_col denom_col kind fmt fallback', defaults=(None,))
+
+INTERCEPTIONS_COL = 'Tentativas bem-sucedidas de interceptação de cruzamento e passe'
+FINAL_THIRD_DRIBBLES_COL = 'Dribles no último terço do campo com sucesso'
+
+TACKLES_P90 = MetricSpec("Tackles /90", 'Desarmes', None, 'per90', '{:.2f}')
+INTERCEPTIONS_P90 = MetricSpec("Interceptions /90", INTERCEPTIONS_COL, None, 'per90', '{:.2f}')
+RECOVERIES_P90 = MetricSpec("Ball Recoveries /90", 'Bolas recuperadas', None, 'per90', '{:.2f}')
+PROG_PASSES_P90 = MetricSpec("Progressive Passes /90", 'Passes progressivos', None, 'per90', '{:.2f}')
+CROSSES_P90 = MetricSpec("Crosses /90", 'Cruzamentos', None, 'per90', '{:.2f}')
+PASSES_P90 = MetricSpec("Passes /90", 'Passes', None, 'per90', '{:.2f}')
+SHOTS_P90 = MetricSpec("Shots /90", 'Chutes', None, 'per90', '{:.2f}')
+GOALS_P90 = MetricSpec("Goals /90", 'Gols', None, 'per90', '{:.2f}')
+FINAL_THIRD_DRIBBLES_P90 = MetricSpec("Final Third Dribbles Success /90", FINAL_THIRD_DRIBBLES_COL, None,
+                                      'per90', '{:.2f}')
+
+DEF_DUELS_PCT = MetricSpec("Defensive Duels Won %", 'Disputas na defesa ganhas', 'Disputas na defesa',
+                           'pct_ratio', '{:.1f}%')
+AERIAL_PCT = MetricSpec("Aerial Duels Won %", 'Disputas aéreas ganhas', 'Disputas aéreas',
+                        'pct_ratio', '{:.1f}%', 'denom')
+TACKLE_SUCCESS_PCT = MetricSpec("Tackle Success %", 'Desarmes bem-sucedidos', 'Desarmes',
+                                'pct_ratio', '{:.1f}%', 'denom')
+KEY_PASS_PCT = MetricSpec("Key Pass Accuracy %", 'Passes chave precisos', 'Passes chave',
+                          'pct_ratio', '{:.1f}%', 'denom')
+PROG_PASS_PCT = MetricSpec("Progressive Pass Accuracy %", 'Passes progressivos precisos', 'Passes progressivos',
+                           'pct_ratio', '{:.1f}%', 'denom')
+LONG_PASS_PCT = MetricSpec("Long Pass Accuracy %", 'Passes longos precisos', 'Passes longos',
+                           'pct_ratio', '{:.1f}%', 'denom')
+BOX_PASS_PCT = MetricSpec("Passes into Box Accuracy %", 'Passes para a área precisos', 'Passes para a área',
+                          'pct_ratio', '{:.1f}%', 'denom')
+FINAL_THIRD_PASS_PCT = MetricSpec("Forward to Final Third Pass Accuracy %",
+                                  'Passes para frente até o terço final precisos', 'Passes para o terço final',
+                                  'pct_ratio', '{:.1f}%', 'denom')
+CROSS_PCT = MetricSpec("Cross Accuracy %", 'Cruzamentos precisos', 'Cruzamentos', 'pct_ratio', '{:.1f}%')
+DRIBBLE_PCT = MetricSpec("Dribble Success %", 'Dribles bem-sucedidos', 'Dribles', 'pct_ratio', '{:.1f}%')
+SHOTS_ON_TARGET_PCT = MetricSpec("Shots on Target %", 'Chutes no gol', 'Chutes', 'pct_ratio', '{:.1f}%')
+PASS_PCT = MetricSpec("Pass Accuracy %", 'Passes precisos %', None, 'raw', '{}%')
+
+_MIDFIELDER_KEY_METRICS = ('Desarmes', INTERCEPTIONS_COL, 'Bolas recuperadas', 'Passes progressivos', 'Passes')
+
+# Metrics compared against the position average per role (see POSITION_ROLES), each shown as a /90 value
+_KEY_METRICS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'GK': ('Defesas', 'Defesas difíceis', 'Gols sofridos', 'Passes precisos', 'Passes chave'),
+    'CB': ('Desarmes', INTERCEPTIONS_COL, 'Rebotes', 'Dribles', 'Passes progressivos'),
+    'FB': ('Cruzamentos', 'Passes progressivos', INTERCEPTIONS_COL, 'Bolas recuperadas', 'Desarmes'),
+    'DM': _MIDFIELDER_KEY_METRICS,
+    'CM': _MIDFIELDER_KEY_METRICS,
+    'W': (FINAL_THIRD_DRIBBLES_COL, 'Cruzamentos', 'Passes progressivos', 'Passes', 'Chutes'),
+    'FW': ('Gols', 'Chutes', 'Bolas recuperadas', 'Passes', FINAL_THIRD_DRIBBLES_COL),
+})
+_DEFAULT_KEY_METRICS = ('Passes', 'Passes precisos', 'Faltas', 'Ações / com sucesso')
+
+# Key metrics shown on the overview tab, five per role
+METRICS_BY_ROLE = {
+    'GK': [
+        MetricSpec("Save %", 'Defesas, %', None, 'pct_string', '{:.1f}%'),
+        MetricSpec("Pass Accuracy %", 'Passes precisos %', None, 'pct_string', '{:.1f}%'),
+        MetricSpec("Actions Success %", 'Ações / com sucesso', 'Ações', 'pct_ratio', '{:.1f}%', 'source'),
+        MetricSpec("Goals Conceded /90", 'Gols sofridos', None, 'per90', '{:.2f}'),
+        MetricSpec("Saves /90", 'Defesas', None, 'per90', '{:.2f}'),
+    ],
+    'CB': [TACKLES_P90, INTERCEPTIONS_P90, TACKLE_SUCCESS_PCT, AERIAL_PCT, RECOVERIES_P90],
+    'FB': [CROSSES_P90, CROSS_PCT, PROG_PASSES_P90, DEF_DUELS_PCT, INTERCEPTIONS_P90],
+    'DM': [RECOVERIES_P90, TACKLES_P90, INTERCEPTIONS_P90, DEF_DUELS_PCT, PROG_PASSES_P90],
+    'CM': [
+        DEF_DUELS_PCT, INTERCEPTIONS_P90, PROG_PASSES_P90, RECOVERIES_P90,
+        MetricSpec("Pass Accuracy %", 'Passes precisos %', None, 'pct_string', '{:.1f}%'),
+    ],
+    'W': [
+        MetricSpec("Final 3rd Dribbles Success %", FINAL_THIRD_DRIBBLES_COL, 'Dribles no último terço do campo',
+                   'pct_ratio', '{:.1f}%', 'source'),
+        CROSSES_P90,
+        MetricSpec("xA", 'xA', None, 'raw', '{:.2f}'),
+        KEY_PASS_PCT,
+        SHOTS_ON_TARGET_PCT._replace(fallback='source'),
+    ],
+    'FW': [
+        GOALS_P90,
+        MetricSpec("xG", 'xG', None, 'raw', '{:.2f}'),
+        SHOTS_ON_TARGET_PCT._replace(fallback='source'),
+        MetricSpec("Headed Goals", 'Gols de cabeça', None, 'raw', '{}'),
+        MetricSpec("xA", 'xA', None, 'raw', '{:.2f}'),
+    ],
+}
+
+# Detailed statistics tab: (section title, rows of metrics)
+_MIDFIELDER_STATS = [
+    ("⚽ OFFENSIVE", [[
+        KEY_PASS_PCT, BOX_PASS_PCT,
+        MetricSpec("Passes to Final Third", 'Passes para o terço final', None, 'raw', None),
+        FINAL_THIRD_PASS_PCT,
+        MetricSpec("Assists", 'Assistências', None, 'raw', None),
+    ]]),
+    ("🛡️ DEFENSIVE", [[DEF_DUELS_PCT, TACKLES_P90, INTERCEPTIONS_P90, RECOVERIES_P90, AERIAL_PCT]]),
+    ("🎯 PASSING", [[PASS_PCT, PROG_PASSES_P90, PROG_PASS_PCT, LONG_PASS_PCT, KEY_PASS_PCT]]),
+    ("⏱️ PER 90 MINUTES", [[TACKLES_P90, INTERCEPTIONS_P90, RECOVERIES_P90, PROG_PASSES_P90, PASSES_P90]]),
+    ("📊 ADVANCED", [[
+        MetricSpec("xA", 'xA', None, 'raw', None),
+        MetricSpec("Key Passes", 'Passes chave', None, 'raw', None),
+        MetricSpec("Passes into Box", 'Passes para a área', None, 'raw', None),
+        MetricSpec("Ball Losses in Own Half", 'Bolas perdidas após passes no próprio campo', None, 'raw', None),
+        MetricSpec("Poor Ball Control", 'Controle de bola ruim', None, 'raw', None),
+    ]]),
+]
+
+STATS_BY_ROLE = {
+    'GK': [
+        ("🛡️ DEFENSIVE", [
+            [
+                MetricSpec("Opponent Shots", 'Chutes do adversário', None, 'raw', None),
+                MetricSpec("Shots on Goal Against", 'Chutes do adversário no gol', None, 'raw', None),
+                MetricSpec("Goals Conceded", 'Gols sofridos', None, 'raw', None),
+                MetricSpec("Saves", 'Defesas', None, 'raw', None),
+            ],
+            [
+                MetricSpec("Save %", 'Defesas, %', None, 'raw', '{}%'),
+                MetricSpec("Difficult Saves", 'Defesas difíceis', None, 'raw', None),
+            ],
+        ]),
+        ("🎯 PASSING", [[
+            MetricSpec("Passes", 'Passes', None, 'raw', None),
+            MetricSpec("Accurate Passes", 'Passes precisos', None, 'raw', None),
+            PASS_PCT,
+            MetricSpec("Key Passes", 'Passes chave', None, 'raw', None),
+        ]]),
+        ("⏱️ PER 90 MINUTES", [[
+            MetricSpec("Saves /90", 'Defesas', None, 'per90', '{:.2f}'),
+            MetricSpec("Difficult Saves /90", 'Defesas difíceis', None, 'per90', '{:.2f}'),
+            MetricSpec("Goals Conceded /90", 'Gols sofridos', None, 'per90', '{:.2f}'),
+            MetricSpec("Accurate Passes /90", 'Passes precisos', None, 'per90', '{:.2f}'),
+            MetricSpec("Key Passes /90", 'Passes chave', None, 'per90', '{:.2f}'),
+        ]]),
+        ("📊 ADVANCED", [[
+            MetricSpec("Cross/Pass Interception Attempts",
+                       'Tentativas de interceptação de cruzamento e passe', None, 'raw', None),
+            MetricSpec("Successful Cross/Pass Interceptions", INTERCEPTIONS_COL, None, 'raw', None),
+            MetricSpec("Cross/Pass Interception Success %", INTERCEPTIONS_COL,
+                       'Tentativas de interceptação de cruzamento e passe', 'pct_ratio', '{:.1f}%'),
+        ]]),
+    ],
+    'CB': [
+        ("🛡️ DEFENSIVE", [[
+            DEF_DUELS_PCT, TACKLES_P90, INTERCEPTIONS_P90, RECOVERIES_P90,
+            MetricSpec("Fouls Committed", 'Faltas cometidas', None, 'raw', None),
+        ]]),
+        ("🎯 PASSING", [[
+            PASS_PCT, PROG_PASSES_P90, PROG_PASS_PCT, KEY_PASS_PCT,
+            MetricSpec("Passes to Final Third", 'Passes para o terço final', None, 'raw', None),
+        ]]),
+        ("⏱️ PER 90 MINUTES", [[FINAL_THIRD_DRIBBLES_P90, CROSSES_P90, PROG_PASSES_P90, PASSES_P90, SHOTS_P90]]),
+        ("📊 ADVANCED", [[
+            MetricSpec("xA", 'xA', None, 'raw', None),
+            MetricSpec("Key Passes", 'Passes chave', None, 'raw', None),
+            MetricSpec("Passes into Box", 'Passes para a área', None, 'raw', None),
+            FINAL_THIRD_PASS_PCT,
+            MetricSpec("Poor Ball Control", 'Controle de bola ruim', None, 'raw', None),
+        ]]),
+    ],
+    'FB': [
+        ("⚽ OFFENSIVE", [[CROSS_PCT, BOX_PASS_PCT, KEY_PASS_PCT, DRIBBLE_PCT, SHOTS_ON_TARGET_PCT]]),
+        ("🛡️ DEFENSIVE", [[
+            DEF_DUELS_PCT, AERIAL_PCT, TACKLE_SUCCESS_PCT,
+            MetricSpec("Ball Recoveries in Opposition Half", 'Bolas recuperadas no campo do adversário',
+                       None, 'raw', None),
+            MetricSpec("Fouls Committed", 'Faltas cometidas', None, 'raw', None),
+        ]]),
+        ("🎯 PASSING", [[PASS_PCT, PROG_PASS_PCT, LONG_PASS_PCT, FINAL_THIRD_PASS_PCT, KEY_PASS_PCT]]),
+        ("⏱️ PER 90 MINUTES", [[CROSSES_P90, PROG_PASSES_P90, INTERCEPTIONS_P90, RECOVERIES_P90, TACKLES_P90]]),
+        ("📊 ADVANCED", [[
+            MetricSpec("xA", 'xA', None, 'raw', None),
+            MetricSpec("xG", 'xG', None, 'raw', None),
+            MetricSpec("Passes to Final Third", 'Passes para o terço final', None, 'raw', None),
+            MetricSpec("Final Third Dribbles Success %", FINAL_THIRD_DRIBBLES_COL, 'Dribles no último terço do campo',
+                       'pct_ratio', '{:.1f}%', 'source'),
+            MetricSpec("Ball Losses in Own Half", 'Bolas perdidas após passes no próprio campo', None, 'raw', None),
+        ]]),
+    ],
+    'DM': _MIDFIELDER_STATS,
+    'CM': _MIDFIELDER_STATS,
+    'W': [
+        ("⚽ OFFENSIVE", [[DRIBBLE_PCT, CROSSES_P90, KEY_PASS_PCT, BOX_PASS_PCT, SHOTS_ON_TARGET_PCT]]),
+        ("🛡️ DEFENSIVE", [[
+            DEF_DUELS_PCT, TACKLES_P90, INTERCEPTIONS_P90, RECOVERIES_P90,
+            MetricSpec("Fouls Committed", 'Faltas cometidas', None, 'raw', None),
+        ]]),
+        ("🎯 PASSING", [[
+            PASS_PCT, PROG_PASSES_P90, PROG_PASS_PCT, KEY_PASS_PCT,
+            MetricSpec("Passes to Final Third", 'Passes para o terço final', None, 'raw', None),
+        ]]),
+        ("⏱️ PER 90 MINUTES", [[FINAL_THIRD_DRIBBLES_P90, CROSSES_P90, PROG_PASSES_P90, PASSES_P90, SHOTS_P90]]),
+        ("📊 ADVANCED", [[
+            MetricSpec("xA", 'xA', None, 'raw', None),
+            MetricSpec("Key Passes", 'Passes chave', None, 'raw', None),
+            MetricSpec("Passes into Box", 'Passes para a área', None, 'raw', None),
+            FINAL_THIRD_PASS_PCT,
+            MetricSpec("Poor Ball Control", 'Controle de bola ruim', None, 'raw', None),
+        ]]),
+    ],
+    'FW': [
+        ("⚽ OFFENSIVE", [[
+            GOALS_P90,
+            MetricSpec("Headed Goals", 'Gols de cabeça', None, 'raw', None),
+            SHOTS_ON_TARGET_PCT,
+            MetricSpec("Chances Success %", 'Chances bem-sucedidas', 'Chances criadas',
+                       'pct_ratio', '{:.1f}%', 'denom'),
+            MetricSpec("xG", 'xG', None, 'raw', None),
+        ]]),
+        ("🛡️ DEFENSIVE", [[
+            DEF_DUELS_PCT, TACKLES_P90, INTERCEPTIONS_P90, RECOVERIES_P90,
+            MetricSpec("Fouls Committed", 'Faltas cometidas', None, 'raw', None),
+        ]]),
+        ("🎯 PASSING", [[
+            KEY_PASS_PCT, BOX_PASS_PCT,
+            MetricSpec("Passes to Final Third", 'Passes para o terço final', None, 'raw', None),
+            MetricSpec("Assists", 'Assistências', None, 'raw', None),
+            FINAL_THIRD_PASS_PCT,
+        ]]),
+        ("⏱️ PER 90 MINUTES", [[GOALS_P90, SHOTS_P90, RECOVERIES_P90, PASSES_P90, FINAL_THIRD_DRIBBLES_P90]]),
+        ("📊 ADVANCED", [[
+            MetricSpec("xG", 'xG', None, 'raw', None),
+            MetricSpec("xA", 'xA', None, 'raw', None),
+            MetricSpec("Key Passes", 'Passes chave', None, 'raw', None),
+            MetricSpec("Chances Created", 'Chances criadas', None, 'raw', None),
+            MetricSpec("Poor Ball Control", 'Controle de bola ruim', None, 'raw', None),
+        ]]),
+    ],
+}
 
 
 def show_player_profile():
@@ -26,8 +266,14 @@ def show_player_profile():
     player_name = st.session_state.selected_player['name']
     position = st.session_state.selected_player['position']
 
-    # Get player data
-    player_data = st.session_state.data_processor.get_player_data(player_name, position)
+    # Values computed for the displayed player are kept until another player or dataset is shown
+    cache_key = (player_name, position, st.session_state.data_processor.signature)
+    if st.session_state.get('_profile_cache_key') != cache_key:
+        st.session_state._profile_cache_key = cache_key
+        st.session_state._profile_cache = {}
+
+    # Get player data as a plain dict: cheaper lookups than a Series and hashable by the caches
+    player_data = _profile_cached('player_data', lambda: _load_player_dict(player_name, position))
 
     if player_data is None:
         st.error(f"Player {player_name} not found in {position} data!")
@@ -54,11 +300,8 @@ def show_player_profile():
         # Add to favorites button
         if st.button("⭐ Add to Favorites", key="add_to_favorites"):
             try:
-                if 'favorites_manager' not in st.session_state:
-                    from src.favorites_manager import FavoritesManager
-                    st.session_state.favorites_manager = FavoritesManager(st.session_state.data_processor)
-
-                favorites_manager = st.session_state.favorites_manager
+                data_processor = st.session_state.data_processor
+                favorites_manager = _get_favorites_manager(data_processor.signature, data_processor)
 
                 if favorites_manager.add_to_favorites(
                         player_name,
@@ -74,1986 +317,435 @@ def show_player_profile():
 
     st.divider()
 
-    # Main content tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 Overview", "📊 Statistics", "📈 Performance", "🎯 Radar Chart"])
-
-    with tab1:
-        show_player_overview(player_data, position)
-
-    with tab2:
-        show_player_statistics_updated(player_data, position)
-
-    with tab3:
-        show_performance_analysis_updated(player_data, position)
-
-    with tab4:
-        show_customizable_radar_chart_fixed(player_data, position)
-
-
-def show_player_overview(player_data: pd.Series, position: str):
-    """Show player overview with basic info and key metrics"""
-
-    # Personal Information
-    st.subheader("ℹ️ Personal Information")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        st.metric("Age", f"{player_data.get('Idade', 'N/A')} years")
-
-    with col2:
-        st.metric("Height", player_data.get('Altura', 'N/A'))
-
-    with col3:
-        st.metric("Nationality", player_data.get('Nacionalidade', 'N/A'))
-
-    with col4:
-        st.metric("Preferred Foot", player_data.get('Pé', 'N/A'))
-
-    with col5:
-        st.metric("Market Value", player_data.get('Valor de mercado', 'N/A'))
-
-    st.markdown("---")
-
-    # Playing Time
-    st.subheader("⏱️ Playing Time")
-
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        minutes = int(player_data.get('Minutos jogados', 0))
-        st.metric("Minutes Played", f"{minutes:,}")
-
-    with col2:
-        matches = int(player_data.get('Partidas jogadas', 0))
-        st.metric("Matches Played", matches)
-
-    with col3:
-        avg_minutes = round(minutes / matches, 1) if matches > 0 else 0
-        st.metric("Minutes per Match", avg_minutes)
-
-    with col4:
-        # Playing time consistency
-        if matches > 0:
-            consistency = min(100, (minutes / (matches * 90)) * 100)
-            st.metric("Playing Time %", f"{consistency:.1f}%")
-        else:
-            st.metric("Playing Time %", "0.0%")
-
-    st.markdown("---")
-
-    # Key Performance Metrics
-    st.subheader("⚽ Key Performance Metrics")
-
-    show_key_metrics_by_position_updated(player_data, position)
-
-
-def show_key_metrics_by_position_updated(player_data: pd.Series, position: str):
-    """Show position-specific key metrics (UPDATED VERSION with 5 metrics each)"""
+    # Main content sections - st.tabs would run every tab body on each rerun,
+    # so only the selected section is rendered
+    section = st.radio(
+        "View",
+        list(PROFILE_SECTIONS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="profile_section"
+    )
+    PROFILE_SECTIONS[section](player_data, position)
 
-    minutes = player_data.get('Minutos jogados', 0)
-
-    if position == 'GR':
-        # Goalkeeper: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            save_pct = player_data.get('Defesas, %', 0)
-            if isinstance(save_pct, str) and '%' in str(save_pct):
-                try:
-                    pct_value = float(str(save_pct).replace('%', ''))
-                    st.metric("Save %", f"{pct_value:.1f}%")
-                except:
-                    st.metric("Save %", str(save_pct))
-            else:
-                try:
-                    st.metric("Save %", f"{float(save_pct):.1f}%")
-                except:
-                    st.metric("Save %", "0.0%")
-
-        with col2:
-            pass_pct = player_data.get('Passes precisos %', 0)
-            if isinstance(pass_pct, str) and '%' in str(pass_pct):
-                try:
-                    pct_value = float(str(pass_pct).replace('%', ''))
-                    st.metric("Pass Accuracy %", f"{pct_value:.1f}%")
-                except:
-                    st.metric("Pass Accuracy %", str(pass_pct))
-            else:
-                try:
-                    st.metric("Pass Accuracy %", f"{float(pass_pct):.1f}%")
-                except:
-                    st.metric("Pass Accuracy %", "0.0%")
-
-        with col3:
-            acoes_sucesso = player_data.get('Ações / com sucesso', 0)
-            acoes_total = player_data.get('Ações', acoes_sucesso)
-            acoes_pct = (acoes_sucesso / acoes_total * 100) if acoes_total > 0 else 0
-            st.metric("Actions Success %", f"{acoes_pct:.1f}%")
-
-        with col4:
-            goals_conceded = player_data.get('Gols sofridos', 0)
-            goals_per90 = (goals_conceded * 90 / minutes) if minutes > 0 else 0
-            st.metric("Goals Conceded /90", f"{goals_per90:.2f}")
-
-        with col5:
-            saves = player_data.get('Defesas', 0)
-            saves_per90 = (saves * 90 / minutes) if minutes > 0 else 0
-            st.metric("Saves /90", f"{saves_per90:.2f}")
-
-    elif position in ['DCE', 'DCD']:
-        # Centre-Back: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            tackles = player_data.get('Desarmes', 0)
-            tackles_per90 = (tackles * 90 / minutes) if minutes > 0 else 0
-            st.metric("Tackles /90", f"{tackles_per90:.2f}")
-
-        with col2:
-            interceptions = player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0)
-            inter_per90 = (interceptions * 90 / minutes) if minutes > 0 else 0
-            st.metric("Interceptions /90", f"{inter_per90:.2f}")
-
-        with col3:
-            tackles_successful = player_data.get('Desarmes bem-sucedidos', tackles)
-            tackle_success_pct = (tackles_successful / tackles * 100) if tackles > 0 else 0
-            st.metric("Tackle Success %", f"{tackle_success_pct:.1f}%")
-
-        with col4:
-            aerial_duels = player_data.get('Disputas aéreas', 0)
-            aerial_won = player_data.get('Disputas aéreas ganhas', aerial_duels)
-            aerial_pct = (aerial_won / aerial_duels * 100) if aerial_duels > 0 else 0
-            st.metric("Aerial Duels Won %", f"{aerial_pct:.1f}%")
-
-        with col5:
-            ball_recoveries = player_data.get('Bolas recuperadas', 0)
-            recoveries_per90 = (ball_recoveries * 90 / minutes) if minutes > 0 else 0
-            st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-
-    elif position in ['DE', 'DD']:
-        # Full-Back: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            crosses = player_data.get('Cruzamentos', 0)
-            crosses_per90 = (crosses * 90 / minutes) if minutes > 0 else 0
-            st.metric("Crosses /90", f"{crosses_per90:.2f}")
-
-        with col2:
-            crosses_accurate = player_data.get('Cruzamentos precisos', 0)
-            cross_accuracy = (crosses_accurate / crosses * 100) if crosses > 0 else 0
-            st.metric("Cross Accuracy %", f"{cross_accuracy:.1f}%")
-
-        with col3:
-            prog_passes = player_data.get('Passes progressivos', 0)
-            prog_per90 = (prog_passes * 90 / minutes) if minutes > 0 else 0
-            st.metric("Progressive Passes /90", f"{prog_per90:.2f}")
-
-        with col4:
-            def_duels = player_data.get('Disputas na defesa', 0)
-            def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-            def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-            st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-
-        with col5:
-            interceptions = player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0)
-            inter_per90 = (interceptions * 90 / minutes) if minutes > 0 else 0
-            st.metric("Interceptions /90", f"{inter_per90:.2f}")
-
-    elif position == 'MCD':
-        # Defensive Midfielder: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            recoveries = player_data.get('Bolas recuperadas', 0)
-            rec_per90 = (recoveries * 90 / minutes) if minutes > 0 else 0
-            st.metric("Ball Recoveries /90", f"{rec_per90:.2f}")
-
-        with col2:
-            tackles = player_data.get('Desarmes', 0)
-            tackles_per90 = (tackles * 90 / minutes) if minutes > 0 else 0
-            st.metric("Tackles /90", f"{tackles_per90:.2f}")
-
-        with col3:
-            interceptions = player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0)
-            inter_per90 = (interceptions * 90 / minutes) if minutes > 0 else 0
-            st.metric("Interceptions /90", f"{inter_per90:.2f}")
-
-        with col4:
-            def_duels = player_data.get('Disputas na defesa', 0)
-            def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-            def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-            st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-
-        with col5:
-            prog_passes = player_data.get('Passes progressivos', 0)
-            prog_per90 = (prog_passes * 90 / minutes) if minutes > 0 else 0
-            st.metric("Progressive Passes /90", f"{prog_per90:.2f}")
-
-    elif position == 'MC':
-        # Central Midfielder: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            def_duels = player_data.get('Disputas na defesa', 0)
-            def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-            def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-            st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-
-        with col2:
-            interceptions = player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0)
-            inter_per90 = (interceptions * 90 / minutes) if minutes > 0 else 0
-            st.metric("Interceptions /90", f"{inter_per90:.2f}")
-
-        with col3:
-            prog_passes = player_data.get('Passes progressivos', 0)
-            prog_per90 = (prog_passes * 90 / minutes) if minutes > 0 else 0
-            st.metric("Progressive Passes /90", f"{prog_per90:.2f}")
-
-        with col4:
-            ball_recoveries = player_data.get('Bolas recuperadas', 0)
-            rec_per90 = (ball_recoveries * 90 / minutes) if minutes > 0 else 0
-            st.metric("Ball Recoveries /90", f"{rec_per90:.2f}")
-
-        with col5:
-            pass_pct = player_data.get('Passes precisos %', 0)
-            if isinstance(pass_pct, str) and '%' in str(pass_pct):
-                try:
-                    pct_value = float(str(pass_pct).replace('%', ''))
-                    st.metric("Pass Accuracy %", f"{pct_value:.1f}%")
-                except:
-                    st.metric("Pass Accuracy %", str(pass_pct))
-            else:
-                try:
-                    st.metric("Pass Accuracy %", f"{float(pass_pct):.1f}%")
-                except:
-                    st.metric("Pass Accuracy %", "0.0%")
-
-    elif position in ['EE', 'ED']:
-        # Winger: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            final_third_dribbles = player_data.get('Dribles no último terço do campo com sucesso', 0)
-            total_final_third = player_data.get('Dribles no último terço do campo', final_third_dribbles)
-            dribbles_pct = (final_third_dribbles / total_final_third * 100) if total_final_third > 0 else 0
-            st.metric("Final 3rd Dribbles Success %", f"{dribbles_pct:.1f}%")
-
-        with col2:
-            crosses = player_data.get('Cruzamentos', 0)
-            crosses_per90 = (crosses * 90 / minutes) if minutes > 0 else 0
-            st.metric("Crosses /90", f"{crosses_per90:.2f}")
-
-        with col3:
-            xa = player_data.get('xA', 0)
-            st.metric("xA", f"{xa:.2f}")
-
-        with col4:
-            key_passes = player_data.get('Passes chave', 0)
-            key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-            key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-            st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-
-        with col5:
-            shots_on_target = player_data.get('Chutes no gol', 0)
-            total_shots = player_data.get('Chutes', shots_on_target)
-            shots_pct = (shots_on_target / total_shots * 100) if total_shots > 0 else 0
-            st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-
-    elif position == 'PL':
-        # Forward: 5 metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            goals = player_data.get('Gols', 0)
-            goals_per90 = (goals * 90 / minutes) if minutes > 0 else 0
-            st.metric("Goals /90", f"{goals_per90:.2f}")
-
-        with col2:
-            xg = player_data.get('xG', 0)
-            st.metric("xG", f"{xg:.2f}")
-
-        with col3:
-            shots_on_target = player_data.get('Chutes no gol', 0)
-            total_shots = player_data.get('Chutes', shots_on_target)
-            shots_pct = (shots_on_target / total_shots * 100) if total_shots > 0 else 0
-            st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-
-        with col4:
-            headed_goals = player_data.get('Gols de cabeça', 0)
-            st.metric("Headed Goals", f"{headed_goals}")
-
-        with col5:
-            xa = player_data.get('xA', 0)
-            st.metric("xA", f"{xa:.2f}")
-
-
-def show_player_statistics_updated(player_data: pd.Series, position: str):
-    """Show detailed player statistics with position-specific categories (UPDATED VERSION)"""
 
-    st.subheader("📊 Detailed Statistics")
+def _load_player_dict(player_name: str, position: str) -> Optional[Dict[str, Any]]:
+    """Fetch a player's row and pair it with the position's column names"""
 
-    minutes = player_data.get('Minutos jogados', 0)
-
-    if position == 'GR':
-        show_goalkeeper_stats(player_data, minutes)
-    elif position in ['DCE', 'DCD']:
-        show_centreback_stats(player_data, minutes)
-    elif position in ['DE', 'DD']:
-        show_fullback_stats(player_data, minutes)
-    elif position == 'MCD':
-        show_defensive_midfielder_stats(player_data, minutes)
-    elif position == 'MC':
-        show_central_midfielder_stats(player_data, minutes)
-    elif position in ['EE', 'ED']:
-        show_winger_stats(player_data, minutes)
-    elif position == 'PL':
-        show_forward_stats(player_data, minutes)
-
-
-def show_goalkeeper_stats(player_data: pd.Series, minutes: int):
-    """Show goalkeeper-specific statistics"""
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
+    data_processor = st.session_state.data_processor
+    row = data_processor.get_player_row_array(player_name, position)
+    if row is None:
+        return None
+    return dict(zip(data_processor.dataframes[position].columns, row))
 
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Opponent Shots", player_data.get('Chutes do adversário', 0))
-    with col2:
-        st.metric("Shots on Goal Against", player_data.get('Chutes do adversário no gol', 0))
-    with col3:
-        st.metric("Goals Conceded", player_data.get('Gols sofridos', 0))
-    with col4:
-        st.metric("Saves", player_data.get('Defesas', 0))
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        save_pct = player_data.get('Defesas, %', 0)
-        st.metric("Save %", f"{save_pct}%")
-    with col2:
-        st.metric("Difficult Saves", player_data.get('Defesas difíceis', 0))
+def _profile_cached(name: str, compute):
+    """Return a value computed at most once for the player currently shown"""
 
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
+    cache = st.session_state._profile_cache
+    if name not in cache:
+        cache[name] = compute()
+    return cache[name]
 
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Passes", player_data.get('Passes', 0))
-    with col2:
-        st.metric("Accurate Passes", player_data.get('Passes precisos', 0))
-    with col3:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col4:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
 
-    # PER 90
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
+# Each entry holds its data processor alive, so only the most recent datasets are kept
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _get_favorites_manager(data_signature: str, _data_processor):
+    """One FavoritesManager per loaded data processor"""
+    from src.favorites_manager import FavoritesManager
+    return FavoritesManager(_data_processor)
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        saves_per90 = (player_data.get('Defesas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Saves /90", f"{saves_per90:.2f}")
-    with col2:
-        difficult_saves_per90 = (player_data.get('Defesas difíceis', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Difficult Saves /90", f"{difficult_saves_per90:.2f}")
-    with col3:
-        goals_conceded_per90 = (player_data.get('Gols sofridos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Goals Conceded /90", f"{goals_conceded_per90:.2f}")
-    with col4:
-        accurate_passes_per90 = (player_data.get('Passes precisos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Accurate Passes /90", f"{accurate_passes_per90:.2f}")
-    with col5:
-        key_passes_per90 = (player_data.get('Passes chave', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Key Passes /90", f"{key_passes_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Cross/Pass Interception Attempts",
-                  player_data.get('Tentativas de interceptação de cruzamento e passe', 0))
-    with col2:
-        st.metric("Successful Cross/Pass Interceptions",
-                  player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0))
-    with col3:
-        attempts = player_data.get('Tentativas de interceptação de cruzamento e passe', 0)
-        successful = player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0)
-        success_pct = (successful / attempts * 100) if attempts > 0 else 0
-        st.metric("Cross/Pass Interception Success %", f"{success_pct:.1f}%")
+# Each section is its own fragment so widget interactions inside it (e.g. the
+# radar chart controls) rerun only that section instead of the whole profile page
+@st.fragment
+def _overview_fragment(player_data: Mapping[str, Any], position: str):
+    show_player_overview(player_data, position)
 
 
-def show_centreback_stats(player_data: pd.Series, minutes: int):
-    """Show centre-back specific statistics"""
+@st.fragment
+def _statistics_fragment(player_data: Mapping[str, Any], position: str):
+    show_player_statistics_updated(player_data, position)
 
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        st.metric("Fouls Committed", player_data.get('Faltas cometidas', 0))
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
+@st.fragment
+def _performance_fragment(player_data: Mapping[str, Any], position: str):
+    show_performance_analysis_updated(player_data, position)
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col2:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col3:
-        prog_passes = player_data.get('Passes progressivos', 0)
-        prog_passes_accurate = player_data.get('Passes progressivos precisos', prog_passes)
-        prog_pass_pct = (prog_passes_accurate / prog_passes * 100) if prog_passes > 0 else 0
-        st.metric("Progressive Pass Accuracy %", f"{prog_pass_pct:.1f}%")
-    with col4:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col5:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        final_third_dribbles_per90 = (player_data.get('Dribles no último terço do campo com sucesso',
-                                                      0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Final Third Dribbles Success /90", f"{final_third_dribbles_per90:.2f}")
-    with col2:
-        crosses_per90 = (player_data.get('Cruzamentos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Crosses /90", f"{crosses_per90:.2f}")
-    with col3:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col4:
-        passes_per90 = (player_data.get('Passes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Passes /90", f"{passes_per90:.2f}")
-    with col5:
-        shots_per90 = (player_data.get('Chutes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Shots /90", f"{shots_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
+@st.fragment
+def _radar_fragment(player_data: Mapping[str, Any], position: str):
+    show_customizable_radar_chart_fixed(player_data, position)
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xA", player_data.get('xA', 0))
-    with col2:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
-    with col3:
-        st.metric("Passes into Box", player_data.get('Passes para a área', 0))
-    with col4:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-    with col5:
-        st.metric("Poor Ball Control", player_data.get('Controle de bola ruim', 0))
 
+PROFILE_SECTIONS = {
+    "📋 Overview": _overview_fragment,
+    "📊 Statistics": _statistics_fragment,
+    "📈 Performance": _performance_fragment,
+    "🎯 Radar Chart": _radar_fragment,
+}
 
-def show_forward_stats(player_data: pd.Series, minutes: int):
-    """Show forward specific statistics"""
 
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
+@dataclass(slots=True)
+class PlayingTime:
+    """Playing time figures shared by the overview and performance sections"""
+    minutes: int
+    matches: int
+    minutes_per_match: float
+    playing_time_pct: float
+    p90: float
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        goals_per90 = (player_data.get('Gols', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Goals /90", f"{goals_per90:.2f}")
-    with col2:
-        st.metric("Headed Goals", player_data.get('Gols de cabeça', 0))
-    with col3:
-        shots = player_data.get('Chutes', 0)
-        shots_on_target = player_data.get('Chutes no gol', 0)
-        shots_pct = (shots_on_target / shots * 100) if shots > 0 else 0
-        st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-    with col4:
-        chances = player_data.get('Chances criadas', 0)
-        chances_successful = player_data.get('Chances bem-sucedidas', chances)
-        chances_pct = (chances_successful / chances * 100) if chances > 0 else 0
-        st.metric("Chances Success %", f"{chances_pct:.1f}%")
-    with col5:
-        st.metric("xG", player_data.get('xG', 0))
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        st.metric("Fouls Committed", player_data.get('Faltas cometidas', 0))
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
+def build_playing_time(player_data: Mapping[str, Any]) -> PlayingTime:
+    """Derive the playing time figures of a player once"""
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col2:
-        area_passes = player_data.get('Passes para a área', 0)
-        area_passes_accurate = player_data.get('Passes para a área precisos', area_passes)
-        area_pass_pct = (area_passes_accurate / area_passes * 100) if area_passes > 0 else 0
-        st.metric("Passes into Box Accuracy %", f"{area_pass_pct:.1f}%")
-    with col3:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-    with col4:
-        st.metric("Assists", player_data.get('Assistências', 0))
-    with col5:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
+    # One coercion for both counts; blanks or unparsable strings count as 0 instead of raising in int()
+    raw = pd.Series([player_data.get('Minutos jogados', 0), player_data.get('Partidas jogadas', 0)])
+    minutes, matches = pd.to_numeric(raw, errors='coerce').fillna(0).astype(int).tolist()
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        goals_per90 = (player_data.get('Gols', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Goals /90", f"{goals_per90:.2f}")
-    with col2:
-        shots_per90 = (player_data.get('Chutes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Shots /90", f"{shots_per90:.2f}")
-    with col3:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col4:
-        passes_per90 = (player_data.get('Passes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Passes /90", f"{passes_per90:.2f}")
-    with col5:
-        final_third_dribbles_per90 = (player_data.get('Dribles no último terço do campo com sucesso',
-                                                      0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Final Third Dribbles Success /90", f"{final_third_dribbles_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
+    return PlayingTime(
+        minutes=minutes,
+        matches=matches,
+        minutes_per_match=round(minutes / matches, 1) if matches > 0 else 0,
+        # Share of the available 90 minutes per match actually played
+        playing_time_pct=min(100, (minutes / (matches * 90)) * 100) if matches > 0 else 0.0,
+        p90=(90.0 / minutes) if minutes > 0 else 0.0
+    )
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xG", player_data.get('xG', 0))
-    with col2:
-        st.metric("xA", player_data.get('xA', 0))
-    with col3:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
-    with col4:
-        st.metric("Chances Created", player_data.get('Chances criadas', 0))
-    with col5:
-        st.metric("Poor Ball Control", player_data.get('Controle de bola ruim', 0))
 
+def show_player_overview(player_data: Mapping[str, Any], position: str):
+    """Show player overview with basic info and key metrics"""
 
-def get_key_performance_metrics_for_position(position: str) -> List[str]:
-    """Get 5 key performance metrics for comparison by position (UPDATED VERSION)"""
+    # Personal Information
+    st.subheader("ℹ️ Personal Information")
 
-    metrics = {
-        'GR': [
-            'Defesas',  # for Defesas /90
-            'Defesas difíceis',  # for Defesas difíceis /90
-            'Gols sofridos',  # for Gols sofridos /90
-            'Passes precisos',  # for Passes precisos /90
-            'Passes chave'  # for Passes chave /90
-        ],
-        'DCE': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Rebotes',  # for Rebotes /90
-            'Dribles',  # for Dribles /90
-            'Passes progressivos'  # for Passes progressivos /90
-        ],
-        'DCD': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Rebotes',  # for Rebotes /90
-            'Dribles',  # for Dribles /90
-            'Passes progressivos'  # for Passes progressivos /90
-        ],
-        'DE': [
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Desarmes'  # for Desarmes /90
-        ],
-        'DD': [
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Desarmes'  # for Desarmes /90
-        ],
-        'MCD': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes'  # for Passes /90
-        ],
-        'MC': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes'  # for Passes /90
-        ],
-        'EE': [
-            'Dribles no último terço do campo com sucesso',  # for Dribles no último terço /90
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes',  # for Passes /90
-            'Chutes'  # for Chutes /90
-        ],
-        'ED': [
-            'Dribles no último terço do campo com sucesso',  # for Dribles no último terço /90
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes',  # for Passes /90
-            'Chutes'  # for Chutes /90
-        ],
-        'PL': [
-            'Gols',  # for Gols /90
-            'Chutes',  # for Chutes /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Passes',  # for Passes /90
-            'Dribles no último terço do campo com sucesso'  # for Dribles no último terço /90
-        ]
-    }
-
-    return metrics.get(position, ['Passes', 'Passes precisos', 'Faltas', 'Ações / com sucesso'])
-
-
-def show_performance_analysis_updated(player_data: pd.Series, position: str):
-    """Show performance analysis with comparisons (UPDATED VERSION)"""
+    # Invariant for the displayed player, so the rows are built once and only re-emitted on reruns
+    render_metric_pairs(_profile_cached('personal_info', lambda: [
+        ("Age", f"{player_data.get('Idade', 'N/A')} years"),
+        ("Height", player_data.get('Altura', 'N/A')),
+        ("Nationality", player_data.get('Nacionalidade', 'N/A')),
+        ("Preferred Foot", player_data.get('Pé', 'N/A')),
+        ("Market Value", player_data.get('Valor de mercado', 'N/A')),
+    ]))
 
-    # Main section header
-    st.subheader("📈 Performance Analysis")
     st.markdown("---")
 
-    # Position comparison section
-    st.markdown("## 🔄 vs Position Average")
-
-    # Get position averages for comparison
-    team_players = st.session_state.data_processor.get_team_players(st.session_state.selected_team)
-
-    if position in team_players:
-        position_df = team_players[position]
-
-        # Key metrics for comparison (5 metrics per position)
-        key_metrics = get_key_performance_metrics_for_position(position)
+    # Playing Time
+    st.subheader("⏱️ Playing Time")
 
-        comparison_data = []
+    playing_time = _profile_cached('playing_time', lambda: build_playing_time(player_data))
 
-        for metric in key_metrics:
-            if metric in player_data.index and metric in position_df.columns:
-                player_value = player_data[metric]
-
-                # Convert metric column to numeric, handling strings
-                try:
-                    position_series = pd.to_numeric(position_df[metric], errors='coerce')
-                    position_avg = position_series.mean()
-
-                    # Convert player value to numeric
-                    player_value_numeric = pd.to_numeric(player_value, errors='coerce')
-
-                    if pd.notna(player_value_numeric) and pd.notna(position_avg):
-                        # Calculate per 90 values
-                        minutes = player_data.get('Minutos jogados', 0)
-                        player_per90 = (player_value_numeric * 90 / minutes) if minutes > 0 else 0
-
-                        # Calculate average per 90 for position
-                        position_minutes = pd.to_numeric(position_df['Minutos jogados'], errors='coerce')
-                        position_per90_values = []
-                        for idx, (val, mins) in enumerate(zip(position_series, position_minutes)):
-                            if pd.notna(val) and pd.notna(mins) and mins > 0:
-                                position_per90_values.append(val * 90 / mins)
-
-                        position_avg_per90 = sum(position_per90_values) / len(
-                            position_per90_values) if position_per90_values else 0
-
-                        comparison_data.append({
-                            'Metric': f'{metric} /90',
-                            'Player': float(player_per90),
-                            'Position Average': float(position_avg_per90),
-                            'Difference': float(player_per90 - position_avg_per90)
-                        })
-                except Exception as e:
-                    # Skip metric if conversion fails
-                    continue
+    render_metric_pairs([
+        ("Minutes Played", f"{playing_time.minutes:,}"),
+        ("Matches Played", playing_time.matches),
+        ("Minutes per Match", playing_time.minutes_per_match),
+        ("Playing Time %", f"{playing_time.playing_time_pct:.1f}%"),
+    ])
 
-        if comparison_data:
-            # Display comparison
-            for data in comparison_data:
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.metric(
-                        data['Metric'],
-                        f"{data['Player']:.2f}"
-                    )
-
-                with col2:
-                    st.metric(
-                        "Position Avg",
-                        f"{data['Position Average']:.2f}"
-                    )
-
-                with col3:
-                    diff = data['Difference']
-                    delta_color = "normal"
-                    if diff > 0:
-                        delta_text = f"+{diff:.2f}"
-                        delta_color = "normal"
-                    else:
-                        delta_text = f"{diff:.2f}"
-                        delta_color = "inverse"
-
-                    st.metric(
-                        "Difference",
-                        delta_text,
-                        delta=delta_text,
-                        delta_color=delta_color
-                    )
-        else:
-            st.info("No comparable metrics found for position analysis.")
-
-    # Section divider
     st.markdown("---")
 
-    # Performance over time section
-    st.markdown("## 📊 Season Performance")
-
-    show_performance_trends(player_data)
-
-
-def show_performance_trends(player_data: pd.Series):
-    """Show performance trends if data is available"""
-
-    # Show key season metrics
-    col1, col2, col3 = st.columns(3)
-
-    minutes = int(player_data.get('Minutos jogados', 0))
-    matches = int(player_data.get('Partidas jogadas', 0))
-
-    with col1:
-        if matches > 0:
-            consistency = min(100, (minutes / (matches * 90)) * 100)
-            st.metric("Playing Time %", f"{consistency:.1f}%")
-        else:
-            st.metric("Playing Time %", "0.0%")
-
-    with col2:
-        goals = int(player_data.get('Gols', 0))
-        if minutes > 0:
-            goals_per_90 = (goals * 90) / minutes
-            st.metric("Goals per 90min", f"{goals_per_90:.2f}")
-        else:
-            st.metric("Goals per 90min", "0.00")
-
-    with col3:
-        assists = int(player_data.get('Assistências', 0))
-        if minutes > 0:
-            assists_per_90 = (assists * 90) / minutes
-            st.metric("Assists per 90min", f"{assists_per_90:.2f}")
-        else:
-            st.metric("Assists per 90min", "0.00")
-
-
-def show_customizable_radar_chart_fixed(player_data: pd.Series, position: str):
-    """Show customizable radar chart for player analysis - FIXED VERSION"""
-
-    st.subheader("🎯 Customizable Radar Chart Analysis")
+    # Key Performance Metrics
+    st.subheader("⚽ Key Performance Metrics")
 
-    # Get available numeric metrics
-    exclude_cols = ['Jogador', 'Time', 'Nacionalidade', 'Pé', 'Altura', 'Valor de mercado',
-                    'Data de nascimento', 'Contrato expira em', 'Posição', 'Temporada',
-                    'Index', 'Position_File', 'Idade', 'Partidas jogadas', 'Minutos jogados']
+    show_key_metrics_by_position_updated(player_data, position)
 
-    available_metrics = []
-    for col in player_data.index:
-        if col not in exclude_cols and pd.api.types.is_numeric_dtype(type(player_data[col])):
-            if not col.endswith('_percentile') and col != 'Overall_Score':
-                available_metrics.append(col)
 
-    available_metrics = sorted(available_metrics)
+def show_key_metrics_by_position_updated(player_data: Mapping[str, Any], position: str):
+    """Show position-specific key metrics (UPDATED VERSION with 5 metrics each)"""
 
-    if not available_metrics:
-        st.warning("No metrics available for radar chart.")
+    specs = METRICS_BY_ROLE.get(POSITION_ROLES.get(position, position))
+    if specs is None:
         return
 
-    # Create unique keys for the radar chart components using player name and position
-    player_name = player_data.get('Jogador', 'unknown')
-    unique_key = f"radar_{position}_{player_name}".replace(" ", "_").replace(".", "_")
+    playing_time = _profile_cached('playing_time', lambda: build_playing_time(player_data))
+    values = _profile_cached('key_metrics', lambda: evaluate_metrics(player_data, playing_time.p90, specs))
+    render_metric_pairs([(spec.label, value) for spec, value in zip(specs, values)])
 
-    # Initialize radar chart state if not exists
-    radar_state_key = f"{unique_key}_radar_state"
-    if radar_state_key not in st.session_state:
-        st.session_state[radar_state_key] = {
-            'num_metrics': min(6, len(available_metrics)),
-            'selected_metrics': available_metrics[:min(6, len(available_metrics))],
-            'compare_players': []
-        }
 
-    radar_state = st.session_state[radar_state_key]
+@lru_cache(maxsize=256)
+def _to_pct(value: Any, default: float = 0.0) -> float:
+    """Coerce a percentage value such as '87.3%' or 87.3 to a float"""
 
-    # Metric selection
-    st.markdown("### 🔧 Select Variables for Radar Chart")
+    try:
+        return float(str(value).rstrip('%').strip())
+    except ValueError:
+        return default
 
-    # Number of metrics selector
-    max_metrics = min(8, len(available_metrics))
 
-    # Use session state for persistence
-    num_metrics = st.slider(
-        "Number of variables:",
-        min_value=3,
-        max_value=max_metrics,
-        value=radar_state['num_metrics'],
-        key=f"{unique_key}_num_metrics_slider"
-    )
-
-    # Update session state if changed
-    if num_metrics != radar_state['num_metrics']:
-        radar_state['num_metrics'] = num_metrics
-        # Adjust selected metrics if needed
-        if len(radar_state['selected_metrics']) < num_metrics:
-            # Add more metrics
-            current_metrics = set(radar_state['selected_metrics'])
-            for metric in available_metrics:
-                if metric not in current_metrics and len(radar_state['selected_metrics']) < num_metrics:
-                    radar_state['selected_metrics'].append(metric)
-        elif len(radar_state['selected_metrics']) > num_metrics:
-            # Remove excess metrics
-            radar_state['selected_metrics'] = radar_state['selected_metrics'][:num_metrics]
-
-    # Metric selection
-    selected_metrics = []
-    cols = st.columns(2)
-
-    for i in range(num_metrics):
-        col_idx = i % 2
-        with cols[col_idx]:
-            # Get current metric or default
-            current_metric = (radar_state['selected_metrics'][i]
-                              if i < len(radar_state['selected_metrics'])
-                              else available_metrics[min(i, len(available_metrics) - 1)])
-
-            # Find index of current metric
-            try:
-                current_index = available_metrics.index(current_metric)
-            except ValueError:
-                current_index = min(i, len(available_metrics) - 1)
-
-            metric = st.selectbox(
-                f"Variable {i + 1}",
-                available_metrics,
-                index=current_index,
-                key=f"{unique_key}_metric_select_{i}"
-            )
-            selected_metrics.append(metric)
+def evaluate_metrics(player_data: Mapping[str, Any], p90: float, specs: List[MetricSpec]) -> List[Any]:
+    """Compute the display values of a list of metric specs in one vectorised pass (p90 from PlayingTime)"""
 
-    # Update session state
-    radar_state['selected_metrics'] = selected_metrics
+    # Gather both operands up front; missing columns come back as NaN
+    source = np.array([player_data.get(spec.source_col, np.nan) for spec in specs], dtype=object)
+    denom = np.array([player_data.get(spec.denom_col or spec.source_col, np.nan) for spec in specs], dtype=object)
+    source_missing = pd.isna(source)
 
-    # Player comparison option
-    st.markdown("### 👥 Compare with Other Players")
+    numeric = np.array([spec.kind in ('per90', 'pct_ratio') for spec in specs])
+    fallback = np.array([spec.fallback for spec in specs], dtype=object)
+    num = np.zeros(len(specs))
+    den = np.zeros(len(specs))
+    num[numeric] = source[numeric].astype(float)
+    den[numeric] = denom[numeric].astype(float)
 
-    # Get all players from same position across all teams
-    position_df = st.session_state.data_processor.dataframes[position]
-    all_players = position_df['Jogador'].tolist()
-
-    # Remove current player from options
-    other_players = [p for p in all_players if p != player_data.get('Jogador')]
+    # Missing ratio operands fall back to the other side where the spec says so, otherwise to 0
+    num = np.where(np.isnan(num) & (fallback == 'denom'), np.nan_to_num(den), num)
+    den = np.where(np.isnan(den) & (fallback == 'source'), np.nan_to_num(num), den)
+    num = np.nan_to_num(num)
+    den = np.nan_to_num(den)
 
-    compare_players = st.multiselect(
-        "Select players to compare with (optional):",
-        other_players,
-        default=radar_state['compare_players'],
-        max_selections=4,
-        key=f"{unique_key}_compare_players_select"
-    )
+    per90 = num * p90
+    pct = np.divide(num, den, out=np.zeros_like(num), where=den > 0) * 100.0
 
-    # Update session state
-    radar_state['compare_players'] = compare_players
-
-    # Generate button
-    generate_button_key = f"{unique_key}_generate_radar"
-    if st.button("Generate Radar Chart", key=generate_button_key):
-        if len(set(selected_metrics)) >= 3:
-            # Prevent navigation by using a container
-            with st.container():
-                create_customizable_radar_chart_fixed(
-                    player_data, position, selected_metrics, compare_players, unique_key
-                )
+    values = []
+    for i, spec in enumerate(specs):
+        if spec.kind == 'per90':
+            value = per90[i]
+        elif spec.kind == 'pct_ratio':
+            value = pct[i]
         else:
-            st.error("Please select at least 3 different variables")
-
-
-def create_customizable_radar_chart_fixed(player_data: pd.Series, position: str,
-                                          selected_metrics: List[str], compare_players: List[str], unique_key: str):
-    """Create the actual customizable radar chart - FIXED VERSION"""
-
-    # Get position dataframe for percentile calculations
-    position_df = st.session_state.data_processor.dataframes[position]
-
-    # Prepare players data for radar
-    players_data = []
-
-    # Add main player
-    main_player_data = {'Player': player_data.get('Jogador', 'Main Player')}
-    for metric in selected_metrics:
-        if metric in player_data.index:
-            # Calculate percentile for this metric
-            values = pd.to_numeric(position_df[metric], errors='coerce').fillna(0)
-            percentile = (values.rank(pct=True) * 100).fillna(0)
-
-            # Find player's percentile
-            player_row_idx = position_df[position_df['Jogador'] == player_data.get('Jogador')].index
-            if len(player_row_idx) > 0:
-                player_percentile = percentile.iloc[player_row_idx[0]]
-            else:
-                player_percentile = 50  # Default to median
-
-            main_player_data[f'{metric}_percentile'] = player_percentile
-
-    players_data.append(main_player_data)
-
-    # Add comparison players
-    for comp_player_name in compare_players:
-        comp_player_row = position_df[position_df['Jogador'] == comp_player_name]
-        if not comp_player_row.empty:
-            comp_player_data = {'Player': comp_player_name}
-            for metric in selected_metrics:
-                if metric in position_df.columns:
-                    values = pd.to_numeric(position_df[metric], errors='coerce').fillna(0)
-                    percentile = (values.rank(pct=True) * 100).fillna(0)
+            value = 0 if source_missing[i] else source[i]
+            if spec.kind == 'pct_string':
+                # DataProcessor already strips '%' and converts at load; only leftover strings need parsing
+                values.append(f"{_to_pct(value) if isinstance(value, str) else float(value):.1f}%")
+                continue
+        values.append(spec.fmt.format(value) if spec.fmt else value)
 
-                    comp_player_percentile = percentile.iloc[comp_player_row.index[0]]
-                    comp_player_data[f'{metric}_percentile'] = comp_player_percentile
+    return values
 
-            players_data.append(comp_player_data)
 
-    # Create radar chart - use container to prevent navigation issues
-    chart_container = st.container()
-
-    with chart_container:
-        try:
-            from components.charts import ScoutingCharts
-            ScoutingCharts.show_radar_comparison(
-                players_data,
-                selected_metrics,
-                position,
-                f"Custom Radar Chart - {player_data.get('Jogador', 'Player')}"
-            )
-        except ImportError:
-            # Fallback radar chart if components.charts is not available
-            create_simple_radar_chart_fixed(players_data, selected_metrics, position, unique_key)
-
-        # Show explanation
-        with st.expander("📖 Chart Explanation"):
-            st.markdown(f"""
-            **CustomDefensive Duels Won %", f"{def_win_pct:.1f}%""")
-    with col2:
-        aerial_duels = player_data.get('Disputas aéreas', 0)
-        aerial_won = player_data.get('Disputas aéreas ganhas', aerial_duels)
-        aerial_pct = (aerial_won / aerial_duels * 100) if aerial_duels > 0 else 0
-        st.metric("Aerial Duels Won %", f"{aerial_pct:.1f}%")
-    with col3:
-        tackles = player_data.get('Desarmes', 0)
-        tackles_successful = player_data.get('Desarmes bem-sucedidos', tackles)
-        tackle_success_pct = (tackles_successful / tackles * 100) if tackles > 0 else 0
-        st.metric("Tackle Success %", f"{tackle_success_pct:.1f}%")
-    with col4:
-        st.metric("Interceptions",
-                  player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe', 0))
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Ball Recoveries", player_data.get('Bolas recuperadas', 0))
-
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        off_duels = player_data.get('Disputas no ataque', 0)
-        off_duels_won = player_data.get('Disputas no ataque ganhas', 0)
-        off_win_pct = (off_duels_won / off_duels * 100) if off_duels > 0 else 0
-        st.metric("Offensive Duels Won %", f"{off_win_pct:.1f}%")
-    with col2:
-        st.metric("Headed Goals", player_data.get('Gols de cabeça', 0))
-    with col3:
-        shots = player_data.get('Chutes', 0)
-        shots_on_target = player_data.get('Chutes no gol', 0)
-        shots_pct = (shots_on_target / shots * 100) if shots > 0 else 0
-        st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-    with col4:
-        total_goals = player_data.get('Gols', 0)
-        total_shots = player_data.get('Chutes', 0)
-        goals_per_shot_pct = (total_goals / total_shots * 100) if total_shots > 0 else 0
-        st.metric("Goals per Shot %", f"{goals_per_shot_pct:.1f}%")
-    with col5:
-        chances = player_data.get('Chances criadas', 0)
-        chances_successful = player_data.get('Chances bem-sucedidas', chances)
-        chances_pct = (chances_successful / chances * 100) if chances > 0 else 0
-        st.metric("Chances Success %", f"{chances_pct:.1f}%")
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col2:
-        long_passes = player_data.get('Passes longos', 0)
-        long_passes_accurate = player_data.get('Passes longos precisos', long_passes)
-        long_pass_pct = (long_passes_accurate / long_passes * 100) if long_passes > 0 else 0
-        st.metric("Long Pass Accuracy %", f"{long_pass_pct:.1f}%")
-    with col3:
-        prog_passes = player_data.get('Passes progressivos', 0)
-        prog_passes_accurate = player_data.get('Passes progressivos precisos', prog_passes)
-        prog_pass_pct = (prog_passes_accurate / prog_passes * 100) if prog_passes > 0 else 0
-        st.metric("Progressive Pass Accuracy %", f"{prog_pass_pct:.1f}%")
-    with col4:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-    with col5:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col2:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col3:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col4:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col5:
-        aerial_per90 = (player_data.get('Disputas aéreas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Aerial Duels /90", f"{aerial_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xG", player_data.get('xG', 0))
-    with col2:
-        st.metric("xA", player_data.get('xA', 0))
-    with col3:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-    with col4:
-        st.metric("Ball Losses in Own Half", player_data.get('Bolas perdidas no próprio campo', 0))
-    with col5:
-        st.metric("Individual Losses", player_data.get('Perdas individuais', 0))
+def render_metric_pairs(pairs: List[Tuple[str, Any]]):
+    """Render (label, value) pairs as one row of metrics"""
 
+    # Direct col.metric calls avoid entering each column as a context manager
+    cols = st.columns(len(pairs))
+    for col, (label, value) in zip(cols, pairs):
+        col.metric(label, value)
 
-def show_fullback_stats(player_data: pd.Series, minutes: int):
-    """Show full-back specific statistics"""
 
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        crosses = player_data.get('Cruzamentos', 0)
-        crosses_accurate = player_data.get('Cruzamentos precisos', 0)
-        cross_accuracy = (crosses_accurate / crosses * 100) if crosses > 0 else 0
-        st.metric("Cross Accuracy %", f"{cross_accuracy:.1f}%")
-    with col2:
-        area_passes = player_data.get('Passes para a área', 0)
-        area_passes_accurate = player_data.get('Passes para a área precisos', area_passes)
-        area_pass_pct = (area_passes_accurate / area_passes * 100) if area_passes > 0 else 0
-        st.metric("Passes into Box Accuracy %", f"{area_pass_pct:.1f}%")
-    with col3:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col4:
-        dribbles = player_data.get('Dribles', 0)
-        dribbles_successful = player_data.get('Dribles bem-sucedidos', 0)
-        dribble_pct = (dribbles_successful / dribbles * 100) if dribbles > 0 else 0
-        st.metric("Dribble Success %", f"{dribble_pct:.1f}%")
-    with col5:
-        shots = player_data.get('Chutes', 0)
-        shots_on_target = player_data.get('Chutes no gol', 0)
-        shots_pct = (shots_on_target / shots * 100) if shots > 0 else 0
-        st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        aerial_duels = player_data.get('Disputas aéreas', 0)
-        aerial_won = player_data.get('Disputas aéreas ganhas', aerial_duels)
-        aerial_pct = (aerial_won / aerial_duels * 100) if aerial_duels > 0 else 0
-        st.metric("Aerial Duels Won %", f"{aerial_pct:.1f}%")
-    with col3:
-        tackles = player_data.get('Desarmes', 0)
-        tackles_successful = player_data.get('Desarmes bem-sucedidos', tackles)
-        tackle_success_pct = (tackles_successful / tackles * 100) if tackles > 0 else 0
-        st.metric("Tackle Success %", f"{tackle_success_pct:.1f}%")
-    with col4:
-        st.metric("Ball Recoveries in Opposition Half", player_data.get('Bolas recuperadas no campo do adversário', 0))
-    with col5:
-        st.metric("Fouls Committed", player_data.get('Faltas cometidas', 0))
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col2:
-        prog_passes = player_data.get('Passes progressivos', 0)
-        prog_passes_accurate = player_data.get('Passes progressivos precisos', prog_passes)
-        prog_pass_pct = (prog_passes_accurate / prog_passes * 100) if prog_passes > 0 else 0
-        st.metric("Progressive Pass Accuracy %", f"{prog_pass_pct:.1f}%")
-    with col3:
-        long_passes = player_data.get('Passes longos', 0)
-        long_passes_accurate = player_data.get('Passes longos precisos', long_passes)
-        long_pass_pct = (long_passes_accurate / long_passes * 100) if long_passes > 0 else 0
-        st.metric("Long Pass Accuracy %", f"{long_pass_pct:.1f}%")
-    with col4:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-    with col5:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
+def show_player_statistics_updated(player_data: Mapping[str, Any], position: str):
+    """Show detailed player statistics with position-specific categories (UPDATED VERSION)"""
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        crosses_per90 = (player_data.get('Cruzamentos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Crosses /90", f"{crosses_per90:.2f}")
-    with col2:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
+    st.subheader("📊 Detailed Statistics")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xA", player_data.get('xA', 0))
-    with col2:
-        st.metric("xG", player_data.get('xG', 0))
-    with col3:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-    with col4:
-        final_third_dribbles = player_data.get('Dribles no último terço do campo com sucesso', 0)
-        total_final_third_dribbles = player_data.get('Dribles no último terço do campo', final_third_dribbles)
-        final_third_dribble_pct = (
-                    final_third_dribbles / total_final_third_dribbles * 100) if total_final_third_dribbles > 0 else 0
-        st.metric("Final Third Dribbles Success %", f"{final_third_dribble_pct:.1f}%")
-    with col5:
-        st.metric("Ball Losses in Own Half", player_data.get('Bolas perdidas após passes no próprio campo', 0))
-
-
-def show_defensive_midfielder_stats(player_data: pd.Series, minutes: int):
-    """Show defensive midfielder specific statistics"""
-
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
+    role = POSITION_ROLES.get(position, position)
+    if role not in STATS_BY_ROLE:
+        return
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col2:
-        area_passes = player_data.get('Passes para a área', 0)
-        area_passes_accurate = player_data.get('Passes para a área precisos', area_passes)
-        area_pass_pct = (area_passes_accurate / area_passes * 100) if area_passes > 0 else 0
-        st.metric("Passes into Box Accuracy %", f"{area_pass_pct:.1f}%")
-    with col3:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-    with col4:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-    with col5:
-        st.metric("Assists", player_data.get('Assistências', 0))
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
+    playing_time = _profile_cached('playing_time', lambda: build_playing_time(player_data))
+    data_signature = st.session_state.data_processor.signature
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        aerial_duels = player_data.get('Disputas aéreas', 0)
-        aerial_won = player_data.get('Disputas aéreas ganhas', aerial_duels)
-        aerial_pct = (aerial_won / aerial_duels * 100) if aerial_duels > 0 else 0
-        st.metric("Aerial Duels Won %", f"{aerial_pct:.1f}%")
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
+    render_stats(compute_stats(data_signature, player_data.get('Jogador'), position, playing_time.p90, role,
+                               player_data))
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col2:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col3:
-        prog_passes = player_data.get('Passes progressivos', 0)
-        prog_passes_accurate = player_data.get('Passes progressivos precisos', prog_passes)
-        prog_pass_pct = (prog_passes_accurate / prog_passes * 100) if prog_passes > 0 else 0
-        st.metric("Progressive Pass Accuracy %", f"{prog_pass_pct:.1f}%")
-    with col4:
-        long_passes = player_data.get('Passes longos', 0)
-        long_passes_accurate = player_data.get('Passes longos precisos', long_passes)
-        long_pass_pct = (long_passes_accurate / long_passes * 100) if long_passes > 0 else 0
-        st.metric("Long Pass Accuracy %", f"{long_pass_pct:.1f}%")
-    with col5:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col2:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col3:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col4:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col5:
-        passes_per90 = (player_data.get('Passes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Passes /90", f"{passes_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
+# One entry per player and role viewed, bounded like the other signature-keyed caches
+@st.cache_data(show_spinner=False, max_entries=256)
+def compute_stats(data_signature: str, player_name: str, position: str, p90: float, role: str,
+                  _player_data: Mapping[str, Any]):
+    """Evaluate the statistics sections for a role"""
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xA", player_data.get('xA', 0))
-    with col2:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
-    with col3:
-        st.metric("Passes into Box", player_data.get('Passes para a área', 0))
-    with col4:
-        st.metric("Ball Losses in Own Half", player_data.get('Bolas perdidas após passes no próprio campo', 0))
-    with col5:
-        st.metric("Poor Ball Control", player_data.get('Controle de bola ruim', 0))
+    # Keyed on who the player is rather than on a hash of the whole row
+    player_data = _player_data
 
+    sections = STATS_BY_ROLE[role]
 
-def show_central_midfielder_stats(player_data: pd.Series, minutes: int):
-    """Show central midfielder specific statistics"""
+    # Evaluate every distinct metric of the position once (several appear in more
+    # than one section, e.g. Goals /90 for forwards), then put the values back in place
+    specs = list(dict.fromkeys(spec for _, rows in sections for row in rows for spec in row))
+    values = dict(zip(specs, evaluate_metrics(player_data, p90, specs)))
 
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
+    return [
+        (title, [[(spec.label, values[spec]) for spec in row] for row in rows])
+        for title, rows in sections
+    ]
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col2:
-        area_passes = player_data.get('Passes para a área', 0)
-        area_passes_accurate = player_data.get('Passes para a área precisos', area_passes)
-        area_pass_pct = (area_passes_accurate / area_passes * 100) if area_passes > 0 else 0
-        st.metric("Passes into Box Accuracy %", f"{area_pass_pct:.1f}%")
-    with col3:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-    with col4:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-    with col5:
-        st.metric("Assists", player_data.get('Assistências', 0))
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        aerial_duels = player_data.get('Disputas aéreas', 0)
-        aerial_won = player_data.get('Disputas aéreas ganhas', aerial_duels)
-        aerial_pct = (aerial_won / aerial_duels * 100) if aerial_duels > 0 else 0
-        st.metric("Aerial Duels Won %", f"{aerial_pct:.1f}%")
-
-    # PASSING (same as MCD)
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
+def _section(title: str):
+    """Section header followed by a divider, sent as a single element"""
+    st.markdown(f"## {title}\n\n---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col2:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col3:
-        prog_passes = player_data.get('Passes progressivos', 0)
-        prog_passes_accurate = player_data.get('Passes progressivos precisos', prog_passes)
-        prog_pass_pct = (prog_passes_accurate / prog_passes * 100) if prog_passes > 0 else 0
-        st.metric("Progressive Pass Accuracy %", f"{prog_pass_pct:.1f}%")
-    with col4:
-        long_passes = player_data.get('Passes longos', 0)
-        long_passes_accurate = player_data.get('Passes longos precisos', long_passes)
-        long_pass_pct = (long_passes_accurate / long_passes * 100) if long_passes > 0 else 0
-        st.metric("Long Pass Accuracy %", f"{long_pass_pct:.1f}%")
-    with col5:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-
-    # PER 90 MINUTES (same as MCD)
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col2:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col3:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col4:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col5:
-        passes_per90 = (player_data.get('Passes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Passes /90", f"{passes_per90:.2f}")
-
-    # ADVANCED (same as MCD)
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
+def render_stats(sections: List[Tuple[str, List[List[Tuple[str, Any]]]]]):
+    """Render pre-computed statistics sections as one table per section"""
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xA", player_data.get('xA', 0))
-    with col2:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
-    with col3:
-        st.metric("Passes into Box", player_data.get('Passes para a área', 0))
-    with col4:
-        st.metric("Ball Losses in Own Half", player_data.get('Bolas perdidas após passes no próprio campo', 0))
-    with col5:
-        st.metric("Poor Ball Control", player_data.get('Controle de bola ruim', 0))
+    for title, rows in sections:
+        _section(title)
 
+        table = pd.DataFrame(
+            [(label, str(value)) for row in rows for label, value in row],
+            columns=['Metric', 'Value']
+        )
+        st.dataframe(table, hide_index=True, use_container_width=True)
 
-def show_winger_stats(player_data: pd.Series, minutes: int):
-    """Show winger specific statistics"""
 
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
+def get_key_performance_metrics_for_position(position: str) -> Tuple[str, ...]:
+    """Get 5 key performance metrics for comparison by position (UPDATED VERSION)"""
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        dribbles = player_data.get('Dribles', 0)
-        dribbles_successful = player_data.get('Dribles bem-sucedidos', 0)
-        dribble_pct = (dribbles_successful / dribbles * 100) if dribbles > 0 else 0
-        st.metric("Dribble Success %", f"{dribble_pct:.1f}%")
-    with col2:
-        crosses_per90 = (player_data.get('Cruzamentos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Crosses /90", f"{crosses_per90:.2f}")
-    with col3:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col4:
-        area_passes = player_data.get('Passes para a área', 0)
-        area_passes_accurate = player_data.get('Passes para a área precisos', area_passes)
-        area_pass_pct = (area_passes_accurate / area_passes * 100) if area_passes > 0 else 0
-        st.metric("Passes into Box Accuracy %", f"{area_pass_pct:.1f}%")
-    with col5:
-        shots = player_data.get('Chutes', 0)
-        shots_on_target = player_data.get('Chutes no gol', 0)
-        shots_pct = (shots_on_target / shots * 100) if shots > 0 else 0
-        st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
+    return _KEY_METRICS.get(POSITION_ROLES.get(position, position), _DEFAULT_KEY_METRICS)
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        st.metric("Fouls Committed", player_data.get('Faltas cometidas', 0))
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        pass_pct = player_data.get('Passes precisos %', 0)
-        st.metric("Pass Accuracy %", f"{pass_pct}%")
-    with col2:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col3:
-        prog_passes = player_data.get('Passes progressivos', 0)
-        prog_passes_accurate = player_data.get('Passes progressivos precisos', prog_passes)
-        prog_pass_pct = (prog_passes_accurate / prog_passes * 100) if prog_passes > 0 else 0
-        st.metric("Progressive Pass Accuracy %", f"{prog_pass_pct:.1f}%")
-    with col4:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col5:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
+def show_performance_analysis_updated(player_data: Mapping[str, Any], position: str):
+    """Show performance analysis with comparisons (UPDATED VERSION)"""
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        final_third_dribbles_per90 = (player_data.get('Dribles no último terço do campo com sucesso',
-                                                      0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Final Third Dribbles Success /90", f"{final_third_dribbles_per90:.2f}")
-    with col2:
-        crosses_per90 = (player_data.get('Cruzamentos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Crosses /90", f"{crosses_per90:.2f}")
-    with col3:
-        prog_passes_per90 = (player_data.get('Passes progressivos', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Progressive Passes /90", f"{prog_passes_per90:.2f}")
-    with col4:
-        passes_per90 = (player_data.get('Passes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Passes /90", f"{passes_per90:.2f}")
-    with col5:
-        shots_per90 = (player_data.get('Chutes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Shots /90", f"{shots_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
+    # Main section header
+    st.subheader("📈 Performance Analysis")
     st.markdown("---")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xA", player_data.get('xA', 0))
-    with col2:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
-    with col3:
-        st.metric("Passes into Box", player_data.get('Passes para a área', 0))
-    with col4:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-    with col5:
-        st.metric("Poor Ball Control", player_data.get('Controle de bola ruim', 0))
+    # Position comparison section
+    st.markdown("## 🔄 vs Position Average")
 
+    # Key metrics for comparison (5 metrics per position)
+    key_metrics = get_key_performance_metrics_for_position(position)
 
-def show_forward_stats(player_data: pd.Series, minutes: int):
-    """Show forward specific statistics"""
+    # Get position averages for comparison
+    data_processor = st.session_state.data_processor
+    position_means = _position_per90_means(
+        data_processor.signature, st.session_state.selected_team, position, key_metrics, data_processor
+    )
 
-    # OFFENSIVE
-    st.markdown("## ⚽ OFFENSIVE")
-    st.markdown("---")
+    if position_means is not None:
+        comparison_data = []
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        goals_per90 = (player_data.get('Gols', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Goals /90", f"{goals_per90:.2f}")
-    with col2:
-        st.metric("Headed Goals", player_data.get('Gols de cabeça', 0))
-    with col3:
-        shots = player_data.get('Chutes', 0)
-        shots_on_target = player_data.get('Chutes no gol', 0)
-        shots_pct = (shots_on_target / shots * 100) if shots > 0 else 0
-        st.metric("Shots on Target %", f"{shots_pct:.1f}%")
-    with col4:
-        chances = player_data.get('Chances criadas', 0)
-        chances_successful = player_data.get('Chances bem-sucedidas', chances)
-        chances_pct = (chances_successful / chances * 100) if chances > 0 else 0
-        st.metric("Chances Success %", f"{chances_pct:.1f}%")
-    with col5:
-        st.metric("xG", player_data.get('xG', 0))
-
-    # DEFENSIVE
-    st.markdown("## 🛡️ DEFENSIVE")
-    st.markdown("---")
+        # Same per-90 factor as the other sections, from the coerced minutes
+        playing_time = _profile_cached('playing_time', lambda: build_playing_time(player_data))
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        def_duels = player_data.get('Disputas na defesa', 0)
-        def_duels_won = player_data.get('Disputas na defesa ganhas', 0)
-        def_win_pct = (def_duels_won / def_duels * 100) if def_duels > 0 else 0
-        st.metric("Defensive Duels Won %", f"{def_win_pct:.1f}%")
-    with col2:
-        tackles_per90 = (player_data.get('Desarmes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Tackles /90", f"{tackles_per90:.2f}")
-    with col3:
-        inter_per90 = (player_data.get('Tentativas bem-sucedidas de interceptação de cruzamento e passe',
-                                       0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Interceptions /90", f"{inter_per90:.2f}")
-    with col4:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col5:
-        st.metric("Fouls Committed", player_data.get('Faltas cometidas', 0))
-
-    # PASSING
-    st.markdown("## 🎯 PASSING")
-    st.markdown("---")
+        compared = [metric for metric in position_means if metric in player_data]
+        # Convert the player's values to numeric and scale them to per 90 in one batch
+        player_values = pd.Series([player_data[metric] for metric in compared], dtype=object)
+        player_per90s = pd.to_numeric(player_values, errors='coerce').to_numpy(dtype='float64') * playing_time.p90
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        key_passes = player_data.get('Passes chave', 0)
-        key_passes_accurate = player_data.get('Passes chave precisos', key_passes)
-        key_pass_pct = (key_passes_accurate / key_passes * 100) if key_passes > 0 else 0
-        st.metric("Key Pass Accuracy %", f"{key_pass_pct:.1f}%")
-    with col2:
-        area_passes = player_data.get('Passes para a área', 0)
-        area_passes_accurate = player_data.get('Passes para a área precisos', area_passes)
-        area_pass_pct = (area_passes_accurate / area_passes * 100) if area_passes > 0 else 0
-        st.metric("Passes into Box Accuracy %", f"{area_pass_pct:.1f}%")
-    with col3:
-        st.metric("Passes to Final Third", player_data.get('Passes para o terço final', 0))
-    with col4:
-        st.metric("Assists", player_data.get('Assistências', 0))
-    with col5:
-        final_third_passes = player_data.get('Passes para o terço final', 0)
-        final_third_accurate = player_data.get('Passes para frente até o terço final precisos', final_third_passes)
-        final_third_pct = (final_third_accurate / final_third_passes * 100) if final_third_passes > 0 else 0
-        st.metric("Forward to Final Third Pass Accuracy %", f"{final_third_pct:.1f}%")
-
-    # PER 90 MINUTES
-    st.markdown("## ⏱️ PER 90 MINUTES")
-    st.markdown("---")
+        for metric, player_per90 in zip(compared, player_per90s):
+            position_avg, position_avg_per90 = position_means[metric]
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        goals_per90 = (player_data.get('Gols', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Goals /90", f"{goals_per90:.2f}")
-    with col2:
-        shots_per90 = (player_data.get('Chutes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Shots /90", f"{shots_per90:.2f}")
-    with col3:
-        recoveries_per90 = (player_data.get('Bolas recuperadas', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Ball Recoveries /90", f"{recoveries_per90:.2f}")
-    with col4:
-        passes_per90 = (player_data.get('Passes', 0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Passes /90", f"{passes_per90:.2f}")
-    with col5:
-        final_third_dribbles_per90 = (player_data.get('Dribles no último terço do campo com sucesso',
-                                                      0) * 90 / minutes) if minutes > 0 else 0
-        st.metric("Final Third Dribbles Success /90", f"{final_third_dribbles_per90:.2f}")
-
-    # ADVANCED
-    st.markdown("## 📊 ADVANCED")
-    st.markdown("---")
+            if not np.isnan(player_per90) and pd.notna(position_avg):
+                comparison_data.append({
+                    'Metric': f'{metric} /90',
+                    'Player': float(player_per90),
+                    'Position Average': float(position_avg_per90),
+                    'Difference': float(player_per90 - position_avg_per90)
+                })
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        st.metric("xG", player_data.get('xG', 0))
-    with col2:
-        st.metric("xA", player_data.get('xA', 0))
-    with col3:
-        st.metric("Key Passes", player_data.get('Passes chave', 0))
-    with col4:
-        st.metric("Chances Created", player_data.get('Chances criadas', 0))
-    with col5:
-        st.metric("Poor Ball Control", player_data.get('Controle de bola ruim', 0))
+        if comparison_data:
+            # Display comparison
+            # One styled table instead of a three-column metric row per compared metric
+            comparison_df = pd.DataFrame(comparison_data)
+            styler = comparison_df.style.format(
+                {'Player': '{:.2f}', 'Position Average': '{:.2f}', 'Difference': '{:+.2f}'}
+            ).apply(
+                lambda diff: np.where(diff > 0, 'color: green', 'color: red'), subset=['Difference']
+            )
+            st.dataframe(styler, hide_index=True, use_container_width=True)
+        else:
+            st.info("No comparable metrics found for position analysis.")
 
+    # Section divider and performance over time section
+    st.markdown("---\n\n## 📊 Season Performance")
 
-def get_key_performance_metrics_for_position(position: str) -> List[str]:
-    """Get 5 key performance metrics for comparison by position (UPDATED VERSION)"""
+    show_performance_trends(player_data)
 
-    metrics = {
-        'GR': [
-            'Defesas',  # for Defesas /90
-            'Defesas difíceis',  # for Defesas difíceis /90
-            'Gols sofridos',  # for Gols sofridos /90
-            'Passes precisos',  # for Passes precisos /90
-            'Passes chave'  # for Passes chave /90
-        ],
-        'DCE': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Rebotes',  # for Rebotes /90
-            'Dribles',  # for Dribles /90
-            'Passes progressivos'  # for Passes progressivos /90
-        ],
-        'DCD': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Rebotes',  # for Rebotes /90
-            'Dribles',  # for Dribles /90
-            'Passes progressivos'  # for Passes progressivos /90
-        ],
-        'DE': [
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Desarmes'  # for Desarmes /90
-        ],
-        'DD': [
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Desarmes'  # for Desarmes /90
-        ],
-        'MCD': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes'  # for Passes /90
-        ],
-        'MC': [
-            'Desarmes',  # for Desarmes /90
-            'Tentativas bem-sucedidas de interceptação de cruzamento e passe',  # for Interceptações /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes'  # for Passes /90
-        ],
-        'EE': [
-            'Dribles no último terço do campo com sucesso',  # for Dribles no último terço /90
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes',  # for Passes /90
-            'Chutes'  # for Chutes /90
-        ],
-        'ED': [
-            'Dribles no último terço do campo com sucesso',  # for Dribles no último terço /90
-            'Cruzamentos',  # for Cruzamentos /90
-            'Passes progressivos',  # for Passes progressivos /90
-            'Passes',  # for Passes /90
-            'Chutes'  # for Chutes /90
-        ],
-        'PL': [
-            'Gols',  # for Gols /90
-            'Chutes',  # for Chutes /90
-            'Bolas recuperadas',  # for Bolas recuperadas /90
-            'Passes',  # for Passes /90
-            'Dribles no último terço do campo com sucesso'  # for Dribles no último terço /90
-        ]
-    }
-
-    return metrics.get(position, ['Passes', 'Passes precisos', 'Faltas', 'Ações / com sucesso'])
-
-
-def show_performance_analysis_updated(player_data: pd.Series, position: str):
-    """Show performance analysis with comparisons (UPDATED VERSION)"""
 
-    # Main section header
-    st.subheader("📈 Performance Analysis")
-    st.markdown("---")
+@st.cache_data(show_spinner=False, max_entries=64)
+def _position_per90_means(data_signature: str, team: str, position: str, metrics: Tuple[str, ...],
+                          _data_processor) -> Optional[Dict[str, Tuple[float, float]]]:
+    """Average and per-90 average of each metric over a team's players in a position"""
 
-    # Position comparison section
-    st.markdown("## 🔄 vs Position Average")
+    # Pre-grouped row positions of the team rather than copying every position through get_team_players
+    team_rows = _data_processor.team_rows.get(position, {}).get(team)
+    if team_rows is None:
+        return None
 
-    # Get position averages for comparison
-    team_players = st.session_state.data_processor.get_team_players(st.session_state.selected_team)
+    # Team rows of the numeric view, then every position average
+    # and per-90 average in one pass over the block
+    position_num = _data_processor.numeric_dataframes[position].iloc[team_rows]
+    if 'Minutos jogados' not in position_num.columns:
+        # Minutes are optional in the uploads; without them there is nothing to compare per 90
+        return {}
 
-    if position in team_players:
-        position_df = team_players[position]
+    compared = [metric for metric in metrics if metric in position_num.columns]
+    metric_block = position_num[compared].to_numpy(dtype='float64')
+    position_minutes = position_num['Minutos jogados'].to_numpy(dtype='float64')
+    valid = position_minutes > 0
 
-        # Key metrics for comparison (5 metrics per position)
-        key_metrics = get_key_performance_metrics_for_position(position)
+    position_avgs = _column_nanmean(metric_block, np.nan)
+    # Average per 90 for position, over players with minutes played
+    per90_means = _column_nanmean(metric_block[valid] * (90.0 / position_minutes[valid, None]), 0.0)
 
-        comparison_data = []
+    return {metric: (float(avg), float(per90)) for metric, avg, per90 in zip(compared, position_avgs, per90_means)}
 
-        for metric in key_metrics:
-            if metric in player_data.index and metric in position_df.columns:
-                player_value = player_data[metric]
-
-                # Convert metric column to numeric, handling strings
-                try:
-                    position_series = pd.to_numeric(position_df[metric], errors='coerce')
-                    position_avg = position_series.mean()
-
-                    # Convert player value to numeric
-                    player_value_numeric = pd.to_numeric(player_value, errors='coerce')
-
-                    if pd.notna(player_value_numeric) and pd.notna(position_avg):
-                        # Calculate per 90 values
-                        minutes = player_data.get('Minutos jogados', 0)
-                        player_per90 = (player_value_numeric * 90 / minutes) if minutes > 0 else 0
-
-                        # Calculate average per 90 for position
-                        position_minutes = pd.to_numeric(position_df['Minutos jogados'], errors='coerce')
-                        position_per90_values = []
-                        for idx, (val, mins) in enumerate(zip(position_series, position_minutes)):
-                            if pd.notna(val) and pd.notna(mins) and mins > 0:
-                                position_per90_values.append(val * 90 / mins)
-
-                        position_avg_per90 = sum(position_per90_values) / len(
-                            position_per90_values) if position_per90_values else 0
-
-                        comparison_data.append({
-                            'Metric': f'{metric} /90',
-                            'Player': float(player_per90),
-                            'Position Average': float(position_avg_per90),
-                            'Difference': float(player_per90 - position_avg_per90)
-                        })
-                except Exception as e:
-                    # Skip metric if conversion fails
-                    continue
 
-        if comparison_data:
-            # Display comparison
-            for data in comparison_data:
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.metric(
-                        data['Metric'],
-                        f"{data['Player']:.2f}"
-                    )
-
-                with col2:
-                    st.metric(
-                        "Position Avg",
-                        f"{data['Position Average']:.2f}"
-                    )
-
-                with col3:
-                    diff = data['Difference']
-                    delta_color = "normal"
-                    if diff > 0:
-                        delta_text = f"+{diff:.2f}"
-                        delta_color = "normal"
-                    else:
-                        delta_text = f"{diff:.2f}"
-                        delta_color = "inverse"
-
-                    st.metric(
-                        "Difference",
-                        delta_text,
-                        delta=delta_text,
-                        delta_color=delta_color
-                    )
-        else:
-            st.info("No comparable metrics found for position analysis.")
+def _column_nanmean(block: np.ndarray, empty: float) -> np.ndarray:
+    """Column means ignoring NaN, with `empty` for columns that have no values"""
 
-    # Section divider
-    st.markdown("---")
+    present = ~np.isnan(block)
+    counts = present.sum(axis=0)
+    sums = np.where(present, block, 0.0).sum(axis=0)
+    return np.divide(sums, counts, out=np.full(block.shape[1], empty), where=counts > 0)
 
-    # Performance over time section
-    st.markdown("## 📊 Season Performance")
 
-    show_performance_trends(player_data)
+SEASON_SUMMARY_P90 = [
+    MetricSpec("Goals per 90min", 'Gols', None, 'per90', '{:.2f}'),
+    MetricSpec("Assists per 90min", 'Assistências', None, 'per90', '{:.2f}'),
+]
 
 
-def show_performance_trends(player_data: pd.Series):
+def show_performance_trends(player_data: Mapping[str, Any]):
     """Show performance trends if data is available"""
 
     # Show key season metrics
-    col1, col2, col3 = st.columns(3)
-
-    minutes = int(player_data.get('Minutos jogados', 0))
-    matches = int(player_data.get('Partidas jogadas', 0))
-
-    with col1:
-        if matches > 0:
-            consistency = min(100, (minutes / (matches * 90)) * 100)
-            st.metric("Playing Time %", f"{consistency:.1f}%")
-        else:
-            st.metric("Playing Time %", "0.0%")
-
-    with col2:
-        goals = int(player_data.get('Gols', 0))
-        if minutes > 0:
-            goals_per_90 = (goals * 90) / minutes
-            st.metric("Goals per 90min", f"{goals_per_90:.2f}")
-        else:
-            st.metric("Goals per 90min", "0.00")
-
-    with col3:
-        assists = int(player_data.get('Assistências', 0))
-        if minutes > 0:
-            assists_per_90 = (assists * 90) / minutes
-            st.metric("Assists per 90min", f"{assists_per_90:.2f}")
-        else:
-            st.metric("Assists per 90min", "0.00")
+    playing_time = _profile_cached('playing_time', lambda: build_playing_time(player_data))
+    # Both per-90 rates come out of a single vectorised evaluation
+    per90 = _profile_cached('season_summary', lambda: evaluate_metrics(
+        player_data, playing_time.p90, SEASON_SUMMARY_P90))
+
+    render_metric_pairs([("Playing Time %", f"{playing_time.playing_time_pct:.1f}%")] +
+                        [(spec.label, value) for spec, value in zip(SEASON_SUMMARY_P90, per90)])
+
+
+# Compare-players options shown without a search, and matches shown for a search
+COMPARE_OPTIONS_LIMIT = 200
+COMPARE_SEARCH_LIMIT = 50
+
+# Percentiles only span 0-100, so single precision is plenty and halves the cached frame
+PCT_DTYPE = np.float32
+
+# Fallback radar trace colours as (line, translucent fill) pairs
+RADAR_PALETTE = (
+    ('#FF6B6B', 'rgba(255, 107, 107, 0.3)'),
+    ('#4ECDC4', 'rgba(78, 205, 196, 0.3)'),
+    ('#45B7D1', 'rgba(69, 183, 209, 0.3)'),
+    ('#96CEB4', 'rgba(150, 206, 180, 0.3)'),
+    ('#FECA57', 'rgba(254, 202, 87, 0.3)'),
+)
+
+# Identity, context and playing-time columns never offered as radar axes
+RADAR_EXCLUDE_COLS = frozenset({
+    'Jogador', 'Time', 'Nacionalidade', 'Pé', 'Altura', 'Valor de mercado',
+    'Data de nascimento', 'Contrato expira em', 'Posição', 'Temporada',
+    'Index', 'Position_File', 'Idade', 'Partidas jogadas', 'Minutos jogados', 'Overall_Score',
+})
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _available_radar_metrics(data_signature: str, position: str, _data_processor) -> List[str]:
+    """Sorted numeric columns of a position that can be plotted on the radar chart"""
+
+    # Numeric columns come pre-selected by dtype from the data processor
+    return sorted(
+        col for col in _data_processor.numeric_columns[position]
+        if col not in RADAR_EXCLUDE_COLS and not col.endswith('_percentile')
+    )
 
 
-def show_customizable_radar_chart_fixed(player_data: pd.Series, position: str):
+def show_customizable_radar_chart_fixed(player_data: Mapping[str, Any], position: str):
     """Show customizable radar chart for player analysis - FIXED VERSION"""
 
     st.subheader("🎯 Customizable Radar Chart Analysis")
 
-    # Get available numeric metrics
-    exclude_cols = ['Jogador', 'Time', 'Nacionalidade', 'Pé', 'Altura', 'Valor de mercado',
-                    'Data de nascimento', 'Contrato expira em', 'Posição', 'Temporada',
-                    'Index', 'Position_File', 'Idade', 'Partidas jogadas', 'Minutos jogados']
-
-    available_metrics = []
-    for col in player_data.index:
-        if col not in exclude_cols and pd.api.types.is_numeric_dtype(type(player_data[col])):
-            if not col.endswith('_percentile') and col != 'Overall_Score':
-                available_metrics.append(col)
+    # Bound once; every position lookup below goes through the cached helpers keyed on it
+    data_processor = st.session_state.data_processor
 
-    available_metrics = sorted(available_metrics)
+    # Get available numeric metrics
+    available_metrics = _available_radar_metrics(data_processor.signature, position, data_processor)
 
     if not available_metrics:
         st.warning("No metrics available for radar chart.")
@@ -2106,6 +798,7 @@ def show_customizable_radar_chart_fixed(player_data: pd.Series, position: str):
     # Metric selection
     selected_metrics = []
     cols = st.columns(2)
+    metric_index = {metric: idx for idx, metric in enumerate(available_metrics)}
 
     for i in range(num_metrics):
         col_idx = i % 2
@@ -2116,10 +809,7 @@ def show_customizable_radar_chart_fixed(player_data: pd.Series, position: str):
                               else available_metrics[min(i, len(available_metrics) - 1)])
 
             # Find index of current metric
-            try:
-                current_index = available_metrics.index(current_metric)
-            except ValueError:
-                current_index = min(i, len(available_metrics) - 1)
+            current_index = metric_index.get(current_metric, min(i, len(available_metrics) - 1))
 
             metric = st.selectbox(
                 f"Variable {i + 1}",
@@ -2136,15 +826,24 @@ def show_customizable_radar_chart_fixed(player_data: pd.Series, position: str):
     st.markdown("### 👥 Compare with Other Players")
 
     # Get all players from same position across all teams
-    position_df = st.session_state.data_processor.dataframes[position]
-    all_players = position_df['Jogador'].tolist()
+    all_players = _position_players(data_processor.signature, position, player_data.get('Time'), data_processor)
 
     # Remove current player from options
-    other_players = [p for p in all_players if p != player_data.get('Jogador')]
+    current_player = player_data.get('Jogador')
+    other_players = [p for p in all_players if p != current_player]
+
+    # Search first and cap the options, so the frontend never renders every player of a large position
+    query = st.text_input("Search players", key=f"{unique_key}_compare_search").strip().lower()
+    if query:
+        options = [p for p in other_players if query in p.lower()][:COMPARE_SEARCH_LIMIT]
+    else:
+        options = other_players[:COMPARE_OPTIONS_LIMIT]
+    # Keep earlier selections available even when the current search hides them
+    options += [p for p in radar_state['compare_players'] if p not in options]
 
     compare_players = st.multiselect(
         "Select players to compare with (optional):",
-        other_players,
+        options,
         default=radar_state['compare_players'],
         max_selections=4,
         key=f"{unique_key}_compare_players_select"
@@ -2166,48 +865,77 @@ def show_customizable_radar_chart_fixed(player_data: pd.Series, position: str):
             st.error("Please select at least 3 different variables")
 
 
-def create_customizable_radar_chart_fixed(player_data: pd.Series, position: str,
+@st.cache_data(show_spinner=False, max_entries=64)
+def _position_players(data_signature: str, position: str, team: Optional[str],
+                      _data_processor) -> Tuple[str, ...]:
+    """Names of every player in a position, team-mates first and then alphabetical"""
+
+    df = _data_processor.dataframes[position]
+    teams = df['Time'] if 'Time' in df.columns else pd.Series(None, index=df.index)
+    players = zip(df['Jogador'].astype(str).tolist(), (teams == team).tolist())
+    return tuple(name for name, _ in sorted(players, key=lambda player: (not player[1], player[0])))
+
+
+# Entries are keyed per dataset signature, so stale uploads would otherwise pile up
+@st.cache_data(show_spinner=False, max_entries=32)
+def _position_percentiles(data_signature: str, position: str,
+                          _data_processor) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Percentile (0-100) of every radar metric over all players of a position, with a metric -> column map"""
+
+    metrics = _available_radar_metrics(data_signature, position, _data_processor)
+    position_num = _data_processor.numeric_dataframes[position]
+
+    # Reuse stored '<metric>_percentile' columns where the data already has them; rank only the rest
+    stored = {metric: f'{metric}_percentile' for metric in metrics if f'{metric}_percentile' in position_num.columns}
+    to_rank = [metric for metric in metrics if metric not in stored]
+    # NaN-aware: missing values are left out of the ranking instead of tying at the bottom as zeros,
+    # and end up as 0 below, as in RankingSystem.calculate_percentiles
+    ranked = position_num[to_rank].rank(pct=True).mul(100)
+    if stored:
+        ranked = ranked.join(position_num[list(stored.values())].set_axis(list(stored), axis=1))
+    percentiles = ranked[metrics].fillna(0).to_numpy(dtype=PCT_DTYPE)
+    # Column-major, so selecting a chart's metrics reads contiguous columns
+    return np.asfortranarray(percentiles), {metric: col for col, metric in enumerate(metrics)}
+
+
+def create_customizable_radar_chart_fixed(player_data: Mapping[str, Any], position: str,
                                           selected_metrics: List[str], compare_players: List[str], unique_key: str):
     """Create the actual customizable radar chart - FIXED VERSION"""
 
-    # Get position dataframe for percentile calculations
-    position_df = st.session_state.data_processor.dataframes[position]
+    # Percentiles of every radar metric of the position, ranked once and shared by all charts
+    data_processor = st.session_state.data_processor
+    pct_matrix, metric_cols = _position_percentiles(data_processor.signature, position, data_processor)
 
     # Prepare players data for radar
     players_data = []
 
+    ranked_metrics = [metric for metric in selected_metrics if metric in metric_cols]
+    name_to_idx = data_processor.player_rows[position]
+
+    # Shown players that exist in the position; the main player falls back to the median below
+    main_name = player_data.get('Jogador')
+    main_idx = name_to_idx.get(main_name)
+    shown = [(name, name_to_idx[name]) for name in compare_players if name in name_to_idx]
+    if main_idx is not None:
+        shown.insert(0, (main_name, main_idx))
+
+    # One 2-D slice of only the shown rows and selected metrics, as plain floats
+    percentile_keys = [f'{metric}_percentile' for metric in ranked_metrics]
+    metric_idx = [metric_cols[metric] for metric in ranked_metrics]
+    shown_rows = pct_matrix[np.ix_([idx for _, idx in shown], metric_idx)].tolist()
+    percentiles = {name: dict(zip(percentile_keys, row)) for (name, _), row in zip(shown, shown_rows)}
+
     # Add main player
     main_player_data = {'Player': player_data.get('Jogador', 'Main Player')}
-    for metric in selected_metrics:
-       if metric in player_data.index:
-           # Calculate percentile for this metric
-           values = pd.to_numeric(position_df[metric], errors='coerce').fillna(0)
-           percentile = (values.rank(pct=True) * 100).fillna(0)
-
-           # Find player's percentile
-           player_row_idx = position_df[position_df['Jogador'] == player_data.get('Jogador')].index
-           if len(player_row_idx) > 0:
-               player_percentile = percentile.iloc[player_row_idx[0]]
-           else:
-               player_percentile = 50  # Default to median
-
-           main_player_data[f'{metric}_percentile'] = player_percentile
+    # Default to median when the player is not in the position dataset
+    main_player_data.update(percentiles[main_name] if main_idx is not None
+                            else dict.fromkeys(percentile_keys, 50))
     players_data.append(main_player_data)
 
    # Add comparison players
     for comp_player_name in compare_players:
-       comp_player_row = position_df[position_df['Jogador'] == comp_player_name]
-       if not comp_player_row.empty:
-           comp_player_data = {'Player': comp_player_name}
-           for metric in selected_metrics:
-               if metric in position_df.columns:
-                   values = pd.to_numeric(position_df[metric], errors='coerce').fillna(0)
-                   percentile = (values.rank(pct=True) * 100).fillna(0)
-
-                   comp_player_percentile = percentile.iloc[comp_player_row.index[0]]
-                   comp_player_data[f'{metric}_percentile'] = comp_player_percentile
-
-           players_data.append(comp_player_data)
+       if comp_player_name in name_to_idx:
+           players_data.append({'Player': comp_player_name, **percentiles[comp_player_name]})
 
    # Create radar chart - use container to prevent navigation issues
     chart_container = st.container()
@@ -2248,33 +976,43 @@ def create_simple_radar_chart_fixed(players_data: List[Dict], selected_metrics:
                                    position: str, unique_key: str):
    """Create a simple radar chart using plotly - FIXED VERSION"""
 
+   # Rebuild the figure only when the plotted players, metrics or position change
+   figure_key = repr((position, selected_metrics, players_data))
+   cached = st.session_state.get(f"{unique_key}_radar_figure")
+   if cached is not None and cached[0] == figure_key:
+       fig = cached[1]
+   else:
+       fig = _build_simple_radar_figure(players_data, selected_metrics, position)
+       st.session_state[f"{unique_key}_radar_figure"] = (figure_key, fig)
+
+   # Use st.plotly_chart with unique key to prevent conflicts
+   st.plotly_chart(fig, use_container_width=True, key=f"{unique_key}_plotly_chart")
+
+
+def _build_simple_radar_figure(players_data: List[Dict], selected_metrics: List[str], position: str):
+   """Build the fallback radar figure from the players' percentile values"""
+
    import plotly.graph_objects as go
 
    fig = go.Figure()
 
-   colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57']
+   # Axes and percentile keys are shared by every trace; close the loop by repeating the first axis
+   metrics_display = selected_metrics + [selected_metrics[0]]
+   percentile_keys = [f'{metric}_percentile' for metric in metrics_display]
 
-   for i, player_data in enumerate(players_data):
+   for player_data, (line_color, fill_color) in zip(players_data, itertools.cycle(RADAR_PALETTE)):
        player_name = player_data['Player']
 
        # Get percentile values
-       values = []
-       for metric in selected_metrics:
-           percentile_key = f'{metric}_percentile'
-           value = player_data.get(percentile_key, 50)
-           values.append(value)
-
-       # Close the radar chart by adding first value at the end
-       values.append(values[0])
-       metrics_display = selected_metrics + [selected_metrics[0]]
+       values = [player_data.get(key, 50) for key in percentile_keys]
 
        fig.add_trace(go.Scatterpolar(
            r=values,
            theta=metrics_display,
            fill='toself',
            name=player_name,
-           line=dict(color=colors[i % len(colors)]),
-           fillcolor=colors[i % len(colors)].replace('#', 'rgba(').replace('FF6B6B', '255, 107, 107').replace('4ECDC4', '78, 205, 196').replace('45B7D1', '69, 183, 209').replace('96CEB4', '150, 206, 180').replace('FECA57', '254, 202, 87') + ', 0.3)',
+           line=dict(color=line_color),
+           fillcolor=fill_color,
            opacity=0.7
        ))
 
@@ -2303,5 +1041,4 @@ def create_simple_radar_chart_fixed(players_data: List[Dict], selected_metrics:
        height=500
    )
 
-   # Use st.plotly_chart with unique key to prevent conflicts
-   st.plotly_chart(fig, use_container_width=True, key=f"{unique_key}_plotly_chart")
\ No newline at end of file
+   return fig
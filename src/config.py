@@ -17,6 +17,17 @@ POSITION_GROUPS = {
     "Forwards": ["PL"]
 }
 
+#Canonical role per position, for positions that share the same analysis
+POSITION_ROLES = {
+    "GR": "GK",
+    "DCE": "CB", "DCD": "CB",
+    "DE": "FB", "DD": "FB",
+    "MCD": "DM",
+    "MC": "CM",
+    "EE": "W", "ED": "W",
+    "PL": "FW"
+}
+
 #Metrics to calculate per 90 minutes
 METRICS_PER_90 = [
     "Gols", "Assistências", "Chutes", "Desarmes", "Interceptações",
@@ -1,17 +1,27 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
+from functools import cached_property
 import io
+import uuid
 from .config import POSITIONS_ORDER, METRICS_PER_90
 
 
 class DataProcessor:
     def __init__(self, uploaded_files):
+        # Stable identity of this dataset for cache keys; unlike id() it is never reused by a later upload
+        self.signature = uuid.uuid4().hex
         self.dataframes = {}
         self.positions_order = POSITIONS_ORDER
         self._load_data(uploaded_files)
         self._process_data()
         self._remove_duplicates()  # New step to handle cross-position duplicates
+        self._categorize_names()
+
+    def __setstate__(self, state):
+        # Processors pickled before the signature existed get one on load
+        self.__dict__.update(state)
+        self.__dict__.setdefault('signature', uuid.uuid4().hex)
 
     def _load_data(self, uploaded_files):
         # Load CSV files with cp1252 encoding
@@ -223,6 +233,15 @@ class DataProcessor:
             else:
                 print("✅ No remaining duplicates found!")
 
+    def _categorize_names(self):
+        """Store player names as categoricals so name filters compare integer codes"""
+        # Done last, once rows are final, so each position's categories are exactly its players
+        for pos, df in self.dataframes.items():
+            if 'Jogador' in df.columns:
+                df = df.copy()
+                df['Jogador'] = df['Jogador'].astype('category')
+                self.dataframes[pos] = df
+
     def get_teams(self) -> List[str]:
         # Get list of all teams
         teams = set()
@@ -231,6 +250,35 @@ class DataProcessor:
                 teams.update(df['Time'].dropna().unique())
         return sorted(list(teams))
 
+    @cached_property
+    def team_index(self) -> Dict[str, int]:
+        # Sorted team names mapped to their position, computed once per instance
+        return {team: i for i, team in enumerate(self.get_teams())}
+
+    @cached_property
+    def numeric_dataframes(self) -> Dict[str, pd.DataFrame]:
+        # Numeric columns of each position, selected once per instance and sharing the original index
+        numeric_columns = self.numeric_columns
+        return {pos: df[list(numeric_columns[pos])] for pos, df in self.dataframes.items()}
+
+    @cached_property
+    def team_rows(self) -> Dict[str, Dict[str, np.ndarray]]:
+        # Row positions of each team's players per position, grouped once per instance
+        return {
+            pos: df.groupby('Time', sort=False).indices if 'Time' in df.columns else {}
+            for pos, df in self.dataframes.items()
+        }
+
+    @cached_property
+    def player_rows(self) -> Dict[str, Dict[str, int]]:
+        # Row position of each player name per position; the first row wins for repeated names
+        rows = {}
+        for pos, df in self.dataframes.items():
+            rows[pos] = {}
+            for i, name in enumerate(df['Jogador'].tolist()):
+                rows[pos].setdefault(name, i)
+        return rows
+
     def get_team_players(self, team: str) -> Dict[str, pd.DataFrame]:
         # Get players by position for specific team
         team_players = {}
@@ -252,6 +300,16 @@ class DataProcessor:
                 return player_data.iloc[0]
         return None
 
+    def get_player_row_array(self, player_name: str, position: str) -> Optional[np.ndarray]:
+        """Get a player's row as a plain array, ordered like the position's columns"""
+        if position in self.dataframes:
+            df = self.dataframes[position]
+            row = self.player_rows[position].get(player_name)
+            if row is not None:
+                # One-row slice straight to numpy, without building an intermediate Series
+                return df.iloc[row:row + 1].to_numpy(dtype=object)[0]
+        return None
+
     def get_all_players(self) -> pd.DataFrame:
         # Get all players from all positions
         all_players = []
@@ -264,13 +322,17 @@ class DataProcessor:
             return pd.concat(all_players, ignore_index=True)
         return pd.DataFrame()
 
+    @cached_property
+    def numeric_columns(self) -> Dict[str, tuple]:
+        # Numeric column names per position, from one dtype pass per instance
+        return {
+            pos: tuple(df.select_dtypes(include=[np.number]).columns)
+            for pos, df in self.dataframes.items()
+        }
+
     def get_numeric_columns(self, position: str) -> List[str]:
         """Get list of numeric columns for a position"""
-        if position in self.dataframes:
-            df = self.dataframes[position]
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-            return numeric_cols
-        return []
+        return list(self.numeric_columns.get(position, ()))
 
     def get_duplicate_analysis(self) -> Dict:
         """Get analysis of duplicate players for debugging"""
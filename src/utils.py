@@ -2,6 +2,10 @@ import streamlit as st
 import os
 from pathlib import Path
 
+# Directory for persisted session data, created once per process at import
+DATA_DIR = Path("data/temp")
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+
 
 def ensure_data_directories():
     """Ensure data directories exist"""
@@ -17,11 +21,10 @@ def ensure_data_directories():
 
 def get_data_size():
     """Get size of saved data"""
-    data_dir = Path("data/temp")
-    if not data_dir.exists():
+    if not DATA_DIR.exists():
         return "No data"
 
-    total_size = sum(f.stat().st_size for f in data_dir.glob('*') if f.is_file())
+    total_size = sum(f.stat().st_size for f in DATA_DIR.glob('*') if f.is_file())
 
     if total_size < 1024:
         return f"{total_size} bytes"